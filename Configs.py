@@ -1,4 +1,3 @@
-import pygame
 import os
 
 # --------- Diretorio de Imagens ---------
@@ -10,6 +9,8 @@ IMG_DIR = os.path.join(BASE_DIR, "png-cards")
 SCREEN_WIDTH = 900
 SCREEN_HEIGHT = 600
 FPS = 80
+IDLE_TIMEOUT_MS = 1000   # mesa parada: no máximo 1 quadro por segundo
+ACTIVE_LINGER_MS = 250   # segue em FPS cheio um pouco depois do último evento
 CARD_WIDTH = 80
 CARD_HEIGHT = 120
 CARD_GAP = 20
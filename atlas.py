@@ -0,0 +1,155 @@
+import json
+import os
+import pygame
+from Configs import BASE_DIR, IMG_DIR, RANKS, SUITS, CARD_WIDTH, CARD_HEIGHT, CARD_COLOR, CARD_BORDER, TEXT_COLOR
+
+# --------- Cache do atlas ---------
+CACHE_DIR = os.path.join(BASE_DIR, ".cache")
+ATLAS_PIXELS = "atlas.rgba"
+ATLAS_INDEX = "atlas.json"
+ATLAS_VERSION = 1  # mude quando o conteúdo ou os tamanhos abaixo mudarem
+ATLAS_WIDTH = 1024
+
+# Imagens fora de png-cards: nome -> (arquivo, tamanho final, smooth)
+EXTRA_IMAGES = {
+    'dealer': (os.path.join("persona", "alex.png"), (100, 100), False),
+    'player': (os.path.join("persona", "marim.png"), (100, 150), False),
+    'carteira': (os.path.join("money", "carteira.png"), (63, 60), True),
+    'dinheiro': (os.path.join("money", "dinheiro.png"), (83, 60), True),
+    'logo': (os.path.join("logo", "logo.jpg"), (900, 600), True),
+}
+
+
+def card_name(rank, suit):
+    return f"{rank}_of_{SUITS[suit].lower()}"
+
+
+def source_files():
+    files = [os.path.join(IMG_DIR, card_name(r, s) + ".png") for r in RANKS for s in SUITS]
+    files += [os.path.join(BASE_DIR, path) for path, _, _ in EXTRA_IMAGES.values()]
+    return files
+
+
+def source_signature():
+    """(mtime, size) of every source image; a missing file counts too."""
+    sig = {}
+    for path in source_files():
+        try:
+            st = os.stat(path)
+            sig[os.path.relpath(path, BASE_DIR)] = [st.st_mtime_ns, st.st_size]
+        except OSError:
+            sig[os.path.relpath(path, BASE_DIR)] = None
+    return {"version": ATLAS_VERSION, "card_size": [CARD_WIDTH, CARD_HEIGHT], "files": sig}
+
+
+def placeholder_card(rank, suit):
+    # placeholder se arquivo não existir (retângulo)
+    img = pygame.Surface((CARD_WIDTH, CARD_HEIGHT), pygame.SRCALPHA)
+    img.fill(CARD_COLOR)
+    pygame.draw.rect(img, CARD_BORDER, img.get_rect(), 2)
+    font = pygame.font.SysFont("serif", 20, bold=True)
+    img.blit(font.render(rank[0].upper(), True, TEXT_COLOR), (5, 5))
+    img.blit(font.render(suit, True, TEXT_COLOR), (5, 25))
+    return img
+
+
+def build_images():
+    """Decode and scale every source image, as Game and Menu used to at startup."""
+    images = {}
+    for rank in RANKS:
+        for suit in SUITS:
+            path = os.path.join(IMG_DIR, card_name(rank, suit) + ".png")
+            if os.path.isfile(path):
+                img = pygame.image.load(path).convert_alpha()
+                images[card_name(rank, suit)] = pygame.transform.smoothscale(img, (CARD_WIDTH, CARD_HEIGHT))
+            else:
+                images[card_name(rank, suit)] = placeholder_card(rank, suit)
+
+    # Card back
+    back = pygame.Surface((CARD_WIDTH, CARD_HEIGHT), pygame.SRCALPHA)
+    back.fill((100, 20, 20))
+    pygame.draw.rect(back, (0, 0, 0), back.get_rect(), 2)
+    images['back'] = back
+
+    for name, (path, size, smooth) in EXTRA_IMAGES.items():
+        img = pygame.image.load(os.path.join(BASE_DIR, path)).convert_alpha()
+        scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+        images[name] = scale(img, size)
+    return images
+
+
+def pack(images, width=ATLAS_WIDTH):
+    """Shelf packing, tallest first. Returns ({name: (x, y, w, h)}, height)."""
+    rects = {}
+    x = y = shelf = 0
+    for name in sorted(images, key=lambda n: (-images[n].get_height(), n)):
+        w, h = images[name].get_size()
+        if x + w > width:
+            x, y, shelf = 0, y + shelf, 0
+        rects[name] = (x, y, w, h)
+        x += w
+        shelf = max(shelf, h)
+    return rects, y + shelf
+
+
+def build_atlas(cache_dir=CACHE_DIR):
+    """Build step: pack all scaled images into one RGBA blob plus a JSON index."""
+    images = build_images()
+    rects, height = pack(images)
+    atlas = pygame.Surface((ATLAS_WIDTH, height), pygame.SRCALPHA)
+    for name, (x, y, w, h) in rects.items():
+        atlas.blit(images[name], (x, y))
+
+    os.makedirs(cache_dir, exist_ok=True)
+    pixels_path = os.path.join(cache_dir, ATLAS_PIXELS)
+    index_path = os.path.join(cache_dir, ATLAS_INDEX)
+    index = {"source": source_signature(), "size": [ATLAS_WIDTH, height], "sprites": rects}
+    # Escreve em arquivo temporário e troca, para nunca deixar um cache pela metade
+    with open(pixels_path + ".tmp", "wb") as f:
+        f.write(pygame.image.tobytes(atlas, "RGBA"))
+    os.replace(pixels_path + ".tmp", pixels_path)
+    with open(index_path + ".tmp", "w") as f:
+        json.dump(index, f)
+    os.replace(index_path + ".tmp", index_path)
+    return atlas, rects
+
+
+# Atlas já carregado neste processo (Menu e Game compartilham)
+_loaded = {}
+
+
+def load_atlas(cache_dir=CACHE_DIR):
+    """
+    {name: Surface} sliced from the cached atlas, rebuilding it first when any
+    source file changed. Card names follow card_name(rank, suit). Needs a
+    display mode to be set (convert_alpha).
+    """
+    if cache_dir not in _loaded:
+        _loaded[cache_dir] = _load(cache_dir)
+    return _loaded[cache_dir]
+
+
+def _load(cache_dir):
+    index_path = os.path.join(cache_dir, ATLAS_INDEX)
+    atlas = None
+    try:
+        with open(index_path) as f:
+            index = json.load(f)
+        if index["source"] == source_signature():
+            with open(os.path.join(cache_dir, ATLAS_PIXELS), "rb") as f:
+                atlas = pygame.image.frombytes(f.read(), tuple(index["size"]), "RGBA").convert_alpha()
+            rects = index["sprites"]
+    except (OSError, ValueError, KeyError, pygame.error):
+        atlas = None
+
+    if atlas is None:
+        atlas, rects = build_atlas(cache_dir)
+        atlas = atlas.convert_alpha()
+    return {name: atlas.subsurface(rect) for name, rect in rects.items()}
+
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    _, sprites = build_atlas()
+    print(f"Atlas with {len(sprites)} images written to {CACHE_DIR}")
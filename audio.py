@@ -0,0 +1,96 @@
+import os
+import pygame
+from Configs import BASE_DIR
+
+SOUND_DIR = os.path.join(BASE_DIR, "sounds")
+
+# Efeitos: nome -> arquivo em sounds/
+EFFECTS = {
+    'win': "win.mp3",
+    'lose': "lose.mp3",
+}
+MUSIC = "background.mp3"
+
+
+class SoundManager:
+    """
+    Decodes every effect once and plays them through a fixed pool of
+    reserved mixer channels, so a result never waits on the disk or an MP3
+    decoder. Volume is kept per category: 'music' for the background loop,
+    'sfx' for effects.
+
+    Missing files (or no audio device) are not errors: those sounds are just
+    silent, as before.
+    """
+
+    def __init__(self, channels=4, music_volume=0.1, sfx_volume=0.5, sound_dir=SOUND_DIR):
+        self.sound_dir = sound_dir
+        self.volumes = {'music': music_volume, 'sfx': sfx_volume}
+        self.sounds = {}
+        self.channels = []
+        self._next = 0
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+        except pygame.error:
+            print("Audio device not available. Sound disabled.")
+            return
+
+        # Canais reservados: o mixer não os usa para Sound.play() automático
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), channels))
+        pygame.mixer.set_reserved(channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(channels)]
+        for name in EFFECTS:
+            self.load(name)
+
+    def load(self, name):
+        """Decode effect `name` (cached; None if the file is missing)."""
+        if name not in self.sounds:
+            try:
+                sound = pygame.mixer.Sound(os.path.join(self.sound_dir, EFFECTS[name]))
+                sound.set_volume(self.volumes['sfx'])
+            except (pygame.error, FileNotFoundError):
+                sound = None
+            self.sounds[name] = sound
+        return self.sounds[name]
+
+    def play(self, name):
+        if not self.channels:
+            return None
+        sound = self.load(name)
+        if sound is None:
+            return None
+        channel = self._free_channel()
+        channel.play(sound)
+        return channel
+
+    def _free_channel(self):
+        # Primeiro canal livre; se todos tocam, reaproveita em rodízio
+        for channel in self.channels:
+            if not channel.get_busy():
+                return channel
+        channel = self.channels[self._next]
+        self._next = (self._next + 1) % len(self.channels)
+        return channel
+
+    def set_volume(self, category, volume):
+        volume = max(0.0, min(1.0, volume))
+        self.volumes[category] = volume
+        if not self.channels:
+            return
+        if category == 'music':
+            pygame.mixer.music.set_volume(volume)
+        else:
+            for sound in self.sounds.values():
+                if sound is not None:
+                    sound.set_volume(volume)
+
+    def play_music(self, filename=MUSIC, loops=-1):
+        if not self.channels:
+            return
+        try:
+            pygame.mixer.music.load(os.path.join(self.sound_dir, filename))
+            pygame.mixer.music.set_volume(self.volumes['music'])
+            pygame.mixer.music.play(loops)
+        except pygame.error:
+            print(f"Background music file not found. Add 'sounds/{filename}' to enable music.")
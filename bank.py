@@ -1,6 +1,7 @@
 import pygame
-import json
-import os
+from journal import BankJournal
+from textcache import render_text
+from viewport import outline
 
 class Bank:
     def __init__(self, initial_amount=1000, font=None, save_file="bank.json"):
@@ -20,6 +21,7 @@ class Bank:
         self.input_color = self.input_color_inactive
 
         # Load saved data (if exists)
+        self.journal = BankJournal(save_file)
         self.load_from_json()
 
     def save_to_json(self):
@@ -28,42 +30,44 @@ class Bank:
             "bet": self.bet,
             "min_bet": self.min_bet
         }
-        with open(self.save_file, "w") as f:
-            json.dump(data, f, indent=4)
+        # Write-behind: the journal thread does the disk I/O
+        self.journal.record(data)
 
     def load_from_json(self):
-        if os.path.exists(self.save_file):
-            try:
-                with open(self.save_file, "r") as f:
-                    data = json.load(f)
-                    self.amount = data.get("amount", self.amount)
-                    self.bet = data.get("bet", self.bet)
-                    self.min_bet = data.get("min_bet", self.min_bet)
-                    self.max_bet = self.amount
-            except json.JSONDecodeError:
-                print("Warning: bank.json is corrupted. Using default values.")
-
-    def draw(self, screen, position):
+        data = self.journal.recover()
+        if data:
+            self.amount = data.get("amount", self.amount)
+            self.bet = data.get("bet", self.bet)
+            self.min_bet = data.get("min_bet", self.min_bet)
+            self.max_bet = self.amount
+
+    def draw(self, screen, position, view=None):
+        # position e input_rect ficam na escala base; view converte para a tela
         x, y = position
         self.max_bet = max(self.min_bet, self.amount)
+        font = view.font(self.font) if view else self.font
+        point = view.point if view else tuple
 
         # Draw text labels
-        amt_text = self.font.render(f"Bank: ${self.amount}", True, (255, 255, 255))
-        screen.blit(amt_text, (x, y))
-        bet_text = self.font.render(f"Current Bet: ${self.bet}", True, (255, 255, 255))
-        screen.blit(bet_text, (x - 50, y + 30))  # shift 10 pixels left
+        amt_text = render_text(font, f"Bank: ${self.amount}", True, (255, 255, 255))
+        screen.blit(amt_text, point((x, y)))
+        bet_text = render_text(font, f"Current Bet: ${self.bet}", True, (255, 255, 255))
+        screen.blit(bet_text, point((x - 50, y + 30)))  # shift 10 pixels left
 
         # Draw input box
         self.input_rect.topleft = (x, y + 60)
-        pygame.draw.rect(screen, self.input_color, self.input_rect, 2)
+        if view:
+            outline(screen, self.input_color, view.rect(self.input_rect), view.length(2))
+        else:
+            outline(screen, self.input_color, self.input_rect, 2)
 
         # Render input text
-        text_surface = self.font.render(self.input_text, True, (255, 255, 255))
-        screen.blit(text_surface, (self.input_rect.x + 5, self.input_rect.y + 5))
+        text_surface = render_text(font, self.input_text, True, (255, 255, 255))
+        screen.blit(text_surface, point((self.input_rect.x + 5, self.input_rect.y + 5)))
 
         # Instructions
-        instr_text = self.font.render("Click box, type bet, press Enter", True, (200, 200, 200))
-        screen.blit(instr_text, (x - 175, y + 100))
+        instr_text = render_text(font, "Click box, type bet, press Enter", True, (200, 200, 200))
+        screen.blit(instr_text, point((x - 175, y + 100)))
 
     def handle_event(self, event):
         # Detect clicking on the input box
@@ -101,13 +105,14 @@ class Bank:
                 if event.unicode.isdigit():
                     self.input_text += event.unicode
 
-    def place_bet(self):
-        if self.bet > self.amount:
+    def place_bet(self, amount=None):
+        stake = self.bet if amount is None else amount
+        if stake > self.amount:
             return False
-        self.amount -= self.bet
+        self.amount -= stake
         self.save_to_json()
         return True
 
-    def payout(self, multiplier=2):
-        self.amount += int(self.bet * multiplier)
+    def payout(self, multiplier=2, stake=None):
+        self.amount += int((self.bet if stake is None else stake) * multiplier)
         self.save_to_json()
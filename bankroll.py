@@ -0,0 +1,262 @@
+import argparse
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from cartas import Shoe
+from engine import RoundEngine, Wallet, hand_payout, BLACKJACK, PUSH
+from runner import chunk_seed, CHUNK_ROUNDS
+from strategy import basic_strategy
+
+# True count por rodada, truncado e limitado a [-TC_LIMIT, TC_LIMIT] para indexar o spread
+TC_LIMIT = 10
+# Trajetórias simuladas juntas; limita a memória e mantém os vetores no cache
+BATCH = 1 << 15
+PERCENTILES = (50, 90, 99)
+
+
+def tc_bucket(true_count):
+    return max(-TC_LIMIT, min(TC_LIMIT, int(true_count)))
+
+
+def round_profile(engine):
+    """
+    (stake, even, halves) of a settled round played with a bet of 1:
+    the stakes add up to `stake` bets and the wallet gets back
+    even * bet + halves * int(2.5 * bet), the same truncation Bank.payout does.
+    """
+    if not engine.actions:
+        # Resolvida no deal (naturals): uma mão, uma aposta
+        outcome = engine.outcomes[0]
+        if outcome == BLACKJACK:
+            return 1, 0, 1
+        return 1, int(outcome == PUSH), 0
+    dealer_hand = engine.dealer.hands[0]
+    even = halves = 0
+    for hand, stake in zip(engine.player.hands, engine.bets):
+        multiplier = hand_payout(hand, dealer_hand)
+        if multiplier == 2.5:
+            halves += stake
+        else:
+            even += stake * multiplier
+    return sum(engine.bets), even, halves
+
+
+def play_round(engine, policy):
+    engine.deal()
+    while engine.state == 'playing':
+        engine.play(policy(engine))
+    return round_profile(engine)
+
+
+def profile_chunk(args):
+    """
+    Rows of (true count bucket, stake, even, halves, short even, short
+    halves) for one seeded block. The short columns replay the same cards
+    with a wallet that only covers the base bet, so the engine refuses
+    doubles and splits: the round of a bankroll that cannot cover more.
+    Runs in a worker process.
+    """
+    seed, index, rounds, num_decks, penetration, policy = args
+    shoe = Shoe(num_decks, penetration, rng=random.Random(chunk_seed(seed, index)))
+    engine = RoundEngine(shoe, Wallet(initial_amount=10 ** 18, bet=1))
+    short = RoundEngine(shoe, Wallet(initial_amount=1, bet=1))
+    rows = np.empty((rounds, 6), dtype=np.int8)
+    for i in range(rounds):
+        # Embaralha antes de ler a contagem, senão o deal reseta depois
+        if shoe.needs_shuffle():
+            shoe.shuffle()
+        tc = tc_bucket(shoe.true_count())
+        # Mesmas cartas duas vezes: volta o shoe ao estado do deal entre as duas rodadas
+        state = shoe.remaining, shoe.running, list(shoe.rank_counts)
+        short.wallet.amount = 1
+        _, short_even, short_halves = play_round(short, policy)
+        shoe.remaining, shoe.running, shoe.rank_counts = state
+        rows[i] = (tc, *play_round(engine, policy), short_even, short_halves)
+    return rows
+
+
+class RoundOutcomes:
+    """
+    Empirical distribution of round results from the RoundEngine: the
+    distinct profile_chunk() rows and how often each one came up.
+    Trajectories draw rounds from it independently, so the count's
+    correlation between rounds of the same shoe is not kept.
+    """
+
+    def __init__(self, rows):
+        profiles, inverse = np.unique(rows, axis=0, return_inverse=True)
+        self.rounds = len(rows)
+        self.index = inverse.reshape(-1).astype(np.int32)
+        (self.tc, self.stake, self.even, self.halves,
+         self.short_even, self.short_halves) = (profiles[:, k].astype(np.int64) for k in range(6))
+
+    @classmethod
+    def play(cls, rounds=200000, workers=1, seed=0, num_decks=4, penetration=0.75, policy=None):
+        """Play `rounds` rounds with `policy` (default: basic strategy) in seeded blocks, like runner.simulate."""
+        policy = policy or basic_strategy()
+        jobs = [(seed, index, min(CHUNK_ROUNDS, rounds - start), num_decks, penetration, policy)
+                for index, start in enumerate(range(0, rounds, CHUNK_ROUNDS))]
+        if workers <= 1:
+            chunks = list(map(profile_chunk, jobs))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunks = list(pool.map(profile_chunk, jobs))
+        return cls(np.concatenate(chunks))
+
+    def net(self, profile, bet):
+        """Net win of each round in `profile` at stake `bet` (arrays)."""
+        returned = self.even[profile] * bet + self.halves[profile] * (5 * bet // 2)
+        return returned - self.stake[profile] * bet
+
+    def short_net(self, profile, bet):
+        """Net win of the same rounds when the bankroll covers only the base bet (no double, no split)."""
+        return self.short_even[profile] * bet + self.short_halves[profile] * (5 * bet // 2) - bet
+
+
+def parse_spread(items):
+    """
+    ['10', '2:20', '4:50'] -> bet per true count bucket: 10 below a true
+    count of 2, 20 from 2, 50 from 4 up. A lone number is a flat bet.
+    """
+    bets = np.zeros(2 * TC_LIMIT + 1, dtype=np.int64)
+    steps = []
+    for item in items:
+        count, sep, bet = str(item).rpartition(':')
+        steps.append((int(count) if sep else -TC_LIMIT, int(bet)))
+    for count, bet in sorted(steps):
+        if bet < 1:
+            raise ValueError(f"bet must be at least 1, got {bet}")
+        bets[max(count, -TC_LIMIT) + TC_LIMIT:] = bet
+    if not bets.all():
+        raise ValueError("spread has no bet for the lowest true counts (add a plain base bet)")
+    return bets
+
+
+def simulate(outcomes, trajectories=100000, rounds=1000, initial_amount=1000, spread=(10,), target=None, seed=None):
+    """
+    Play `trajectories` bankrolls side by side for up to `rounds` rounds
+    each. Bank refuses a bet larger than the amount left, so a bankroll
+    below the spread's bet stakes what it has left, and one that cannot
+    cover all of a round's doubles and splits plays it without any, as
+    RoundEngine does. A bankroll is ruined once it cannot cover the
+    smallest bet of the spread; the amount never goes below 0. A
+    trajectory stops when ruined or, with a `target`, when it reaches it.
+
+    Returns a dict: risk_of_ruin, reached_target, ev_per_round and
+    percentiles of max drawdown, final amount, rounds to ruin and rounds to
+    target.
+    """
+    rng = np.random.default_rng(seed)
+    bets = parse_spread(spread)
+    min_bet = int(bets.min())
+    # Resultado de cada rodada gravada com a aposta do spread: sortear uma rodada é um só índice.
+    # Só as rodadas que o saldo não cobre inteiras (saldo < stake máximo) são refeitas
+    profile_bet = bets[outcomes.tc + TC_LIMIT]
+    round_net = outcomes.net(outcomes.index, profile_bet[outcomes.index])
+    max_stake = int(bets.max() * outcomes.stake.max())
+    target = target if target is not None else np.iinfo(np.int64).max
+    final = np.empty(trajectories, dtype=np.int64)
+    drawdown = np.empty(trajectories, dtype=np.int64)
+    ruined_at = np.full(trajectories, -1, dtype=np.int32)
+    reached_at = np.full(trajectories, -1, dtype=np.int32)
+    played = 0
+
+    for start in range(0, trajectories, BATCH):
+        # Estado só das trajetórias vivas, contíguo; compactado quando alguma termina
+        ids = np.arange(start, min(start + BATCH, trajectories))
+        amount = np.full(ids.size, initial_amount, dtype=np.int64)
+        peak = amount.copy()
+        worst = np.zeros(ids.size, dtype=np.int64)
+        r = 0
+
+        while ids.size:
+            if amount.min() < min_bet or amount.max() >= target:
+                broke = amount < min_bet
+                done = amount >= target
+                ruined_at[ids[broke]] = r
+                reached_at[ids[done]] = r
+                ended = broke | done
+                final[ids[ended]] = amount[ended]
+                drawdown[ids[ended]] = worst[ended]
+                keep = ~ended
+                ids, amount, peak, worst = ids[keep], amount[keep], peak[keep], worst[keep]
+            if r == rounds or not ids.size:
+                break
+            r += 1
+
+            drawn = rng.integers(0, outcomes.rounds, ids.size, dtype=np.int32)
+            net = round_net[drawn]
+            low = np.flatnonzero(amount < max_stake)
+            if low.size:
+                profile = outcomes.index[drawn[low]]
+                left = amount[low]
+                bet = np.minimum(profile_bet[profile], left)
+                covered = outcomes.stake[profile] * bet <= left
+                net[low] = np.where(covered, outcomes.net(profile, bet), outcomes.short_net(profile, bet))
+            amount += net
+            played += ids.size
+            np.maximum(peak, amount, out=peak)
+            np.maximum(worst, peak - amount, out=worst)
+
+        final[ids] = amount
+        drawdown[ids] = worst
+
+    def percentiles(values):
+        if not values.size:
+            return dict.fromkeys(PERCENTILES)
+        return dict(zip(PERCENTILES, np.percentile(values, PERCENTILES).tolist()))
+
+    return {
+        "trajectories": trajectories,
+        "rounds": rounds,
+        "rounds_played": played,
+        "risk_of_ruin": float(np.mean(ruined_at >= 0)),
+        "reached_target": float(np.mean(reached_at >= 0)),
+        "ev_per_round": float((final.sum() - initial_amount * trajectories) / played) if played else 0.0,
+        "max_drawdown": percentiles(drawdown),
+        "final_amount": percentiles(final),
+        "rounds_to_ruin": percentiles(ruined_at[ruined_at >= 0]),
+        "rounds_to_target": percentiles(reached_at[reached_at >= 0]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Risk of ruin and bankroll trajectories, many at once with NumPy.")
+    parser.add_argument("--trajectories", type=int, default=100000)
+    parser.add_argument("--rounds", type=int, default=1000, help="rounds per trajectory")
+    parser.add_argument("--bankroll", type=int, default=1000, help="starting amount (Bank's initial_amount)")
+    parser.add_argument("--spread", nargs="+", default=["10"],
+                        help="base bet, then TC:BET steps, e.g. 10 2:20 3:40 4:80 (default: flat 10)")
+    parser.add_argument("--target", type=int, default=None, help="stop a trajectory once its amount reaches this")
+    parser.add_argument("--profile-rounds", type=int, default=200000, help="engine rounds sampled for the outcome distribution")
+    parser.add_argument("--workers", type=int, default=1, help="processes playing the profile rounds")
+    parser.add_argument("--decks", type=int, default=4)
+    parser.add_argument("--penetration", type=float, default=0.75)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    try:
+        parse_spread(args.spread)
+    except ValueError as e:
+        parser.error(f"--spread: {e}")
+
+    start = time.perf_counter()
+    outcomes = RoundOutcomes.play(args.profile_rounds, args.workers, args.seed, args.decks, args.penetration)
+    profiled = time.perf_counter() - start
+    start = time.perf_counter()
+    report = simulate(outcomes, args.trajectories, args.rounds, args.bankroll, args.spread, args.target, args.seed)
+    elapsed = time.perf_counter() - start
+
+    for key, value in report.items():
+        if isinstance(value, dict):
+            value = "  ".join(f"p{q}={'-' if v is None else f'{v:.0f}'}" for q, v in value.items())
+        elif isinstance(value, float):
+            value = f"{value:.4f}"
+        print(f"{key:>16}: {value}")
+    print(f"{'profile':>16}: {args.profile_rounds} rounds in {profiled:.1f}s")
+    print(f"{'simulation':>16}: {elapsed:.1f}s ({report['rounds_played'] / elapsed:.3g} rounds/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+import argparse
+import atexit
+import fnmatch
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+from Configs import BASE_DIR
+from cartas import Deck, Hand, Shoe
+from runner import run_chunk, mimic_dealer
+
+BASELINE_FILE = os.path.join(BASE_DIR, ".cache", "bench_baseline.json")
+DECK_COUNTS = (1, 2, 4, 6, 8)
+SEED = 1234
+
+# nome -> função que roda uma amostra e devolve (operações, segundos)
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    def register(fn):
+        BENCHMARKS[name] = fn
+        return fn
+    return register
+
+
+# --------- Mãos ---------
+def sample_hands(count=2000):
+    """Hands of 2 to 5 cards from a seeded shoe."""
+    deck = Deck(8, rng=random.Random(SEED))
+    deck.shuffle()
+    hands = []
+    for i in range(count):
+        hand = Hand()
+        for _ in range(2 + i % 4):
+            hand.add(deck.draw())
+        hands.append(hand)
+    return hands
+
+
+@benchmark("hand.add")
+def bench_hand_add():
+    deck = Deck(8, rng=random.Random(SEED))
+    deck.shuffle()
+    cards = [deck.draw() for _ in range(400)]
+    start = time.perf_counter()
+    for _ in range(250):
+        hand = Hand()
+        for card in cards:
+            if hand.hard > 21:
+                hand = Hand()
+            hand.add(card)
+    return 250 * len(cards), time.perf_counter() - start
+
+
+@benchmark("hand.evaluate")
+def bench_hand_evaluate():
+    hands = sample_hands()
+    start = time.perf_counter()
+    for _ in range(50):
+        for hand in hands:
+            hand.values()
+            hand.best_value()
+            hand.is_bust()
+    return 50 * len(hands), time.perf_counter() - start
+
+
+# --------- Baralho ---------
+def deck_benchmarks(n):
+    @benchmark(f"deck{n}.init")
+    def bench_init():
+        rounds = max(400, 8000 // n)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            Deck(n)
+        return rounds, time.perf_counter() - start
+
+    @benchmark(f"deck{n}.shuffle")
+    def bench_shuffle():
+        deck = Deck(n, rng=random.Random(SEED))
+        rounds = max(20, 800 // n)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            deck.shuffle()
+        return rounds, time.perf_counter() - start
+
+    @benchmark(f"deck{n}.draw")
+    def bench_draw():
+        deck = Deck(n, rng=random.Random(SEED))
+        deck.shuffle()
+        size = len(deck.shoe)
+        passes = max(20, 2000 // n)
+        start = time.perf_counter()
+        for _ in range(passes):
+            deck.remaining = size  # mesma ordem de novo, sem custo de embaralhar
+            deck._reset_counts()
+            for _ in range(size):
+                deck.draw()
+        return passes * size, time.perf_counter() - start
+
+
+for _n in DECK_COUNTS:
+    deck_benchmarks(_n)
+
+
+# --------- Rodadas ---------
+@benchmark("round.resolve")
+def bench_rounds():
+    rounds = 10000
+    start = time.perf_counter()
+    run_chunk((SEED, 0, rounds, 4, 0.75, 10, mimic_dealer))
+    return rounds, time.perf_counter() - start
+
+
+# --------- Renderização (SDL_VIDEODRIVER=dummy) ---------
+_game = None
+
+
+def headless_game():
+    """One Game on a dummy display, with bank and ledger in a temp dir."""
+    global _game
+    if _game is None:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        import pygame
+        from Configs import SCREEN_WIDTH, SCREEN_HEIGHT
+        from jogo import Game
+        pygame.init()
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        tmp = tempfile.mkdtemp(prefix="bench-")
+        atexit.register(shutil.rmtree, tmp, True)
+        _game = Game(screen, bank_file=os.path.join(tmp, "bank.json"),
+                     ledger_path=os.path.join(tmp, "rounds.ledger"), replay_dir=None)
+        _game.bank.amount = 10 ** 12
+    return _game
+
+
+@benchmark("render.idle")
+def bench_render_idle():
+    game = headless_game()
+    game.render()
+    frames = 2000
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.render()
+    return frames, time.perf_counter() - start
+
+
+@benchmark("render.full")
+def bench_render_full():
+    game = headless_game()
+    frames = 200
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.full_redraw = True
+        game.render()
+    return frames, time.perf_counter() - start
+
+
+@benchmark("render.round")
+def bench_render_round():
+    # Frames com cartas voando: deal, hit/stand, cartas do dealer
+    game = headless_game()
+    # O shoe do Game tem RNG próprio (o random global não afeta as cartas):
+    # um shoe novo com a mesma seed a cada amostra, mesma sequência sempre
+    shoe = game.engine.deck
+    game.engine.deck = Shoe(shoe.num_decks, shoe.penetration, rng=random.Random(SEED))
+    frames = 0
+    elapsed = 0.0
+    for _ in range(5):
+        game.start_round()
+        while True:
+            start = time.perf_counter()
+            game.render()
+            while game.sprites:
+                game.render()
+                frames += 1
+            elapsed += time.perf_counter() - start
+            frames += 1
+            if game.state != 'playing':
+                break
+            if game.player.hands[game.player.current_hand].best_value() < 17:
+                game.player_hit()
+            else:
+                game.player_stand()
+    return frames, elapsed
+
+
+# --------- Execução e comparação ---------
+def run(names, repeat=5):
+    """{name: best ns/op over `repeat` samples}, after one warm-up sample, GC off."""
+    results = {}
+    for name in names:
+        BENCHMARKS[name]()
+        best = None
+        gc.collect()
+        gc.disable()
+        try:
+            for _ in range(repeat):
+                ops, seconds = BENCHMARKS[name]()
+                per_op = seconds / ops * 1e9
+                best = per_op if best is None else min(best, per_op)
+        finally:
+            gc.enable()
+        results[name] = best
+    return results
+
+
+def machine_info():
+    return {"python": platform.python_version(), "platform": platform.platform(),
+            "machine": platform.machine(), "cpus": os.cpu_count(), "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+
+def load_baseline(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_baseline(path, results):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"machine": machine_info(), "results": results}, f, indent=4)
+
+
+def compare(results, baseline, threshold):
+    """[(name, ns/op, baseline ns/op or None, ratio or None, regressed)]."""
+    rows = []
+    for name, value in results.items():
+        base = baseline["results"].get(name) if baseline else None
+        ratio = value / base if base else None
+        rows.append((name, value, base, ratio, ratio is not None and ratio > 1 + threshold))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks of the hot paths, compared against a saved baseline.")
+    parser.add_argument("--only", nargs="*", default=["*"], help="glob patterns of benchmark names")
+    parser.add_argument("--skip-render", action="store_true", help="skip the render.* benchmarks")
+    parser.add_argument("--repeat", type=int, default=5, help="samples per benchmark (best is kept)")
+    parser.add_argument("--threshold", type=float, default=0.25, help="slowdown that counts as a regression (0.25 = 25%%)")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--save", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--list", action="store_true", help="list benchmark names and exit")
+    args = parser.parse_args()
+
+    names = [name for name in BENCHMARKS if any(fnmatch.fnmatch(name, pattern) for pattern in args.only)]
+    if args.skip_render:
+        names = [name for name in names if not name.startswith("render.")]
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    results = run(names, args.repeat)
+    regressions = 0
+    print(f"{'benchmark':<16} {'ns/op':>12} {'baseline':>12} {'ratio':>7}")
+    for name, value, base, ratio, regressed in compare(results, baseline, args.threshold):
+        base_text = f"{base:12.1f}" if base else f"{'-':>12}"
+        ratio_text = f"{ratio:7.2f}" if ratio else f"{'-':>7}"
+        print(f"{name:<16} {value:12.1f} {base_text} {ratio_text}{'  REGRESSION' if regressed else ''}")
+        regressions += regressed
+
+    if args.save:
+        save_baseline(args.baseline, dict((baseline or {}).get("results", {}), **results))
+        print(f"Baseline saved to {args.baseline}")
+    if regressions:
+        print(f"{regressions} benchmark(s) slower than baseline by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
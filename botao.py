@@ -1,5 +1,6 @@
 import pygame
 from Configs import BUTTON_COLOR, BUTTON_HIGHLIGHT, CARD_BORDER, TEXT_COLOR
+from textcache import render_text
 
 class Button:
     def __init__(self, rect, text, font):
@@ -8,14 +9,19 @@ class Button:
         self.font = font
         self.enabled = True
 
-    def draw(self, surf, mouse_pos):
+    def draw(self, surf, mouse_pos, view=None):
+        # view: viewport.Viewport para desenhar fora da escala base
         color = BUTTON_HIGHLIGHT if self.rect.collidepoint(mouse_pos) else BUTTON_COLOR
         if not self.enabled:
             color = (120, 120, 120)
-        pygame.draw.rect(surf, color, self.rect, border_radius=6)
-        pygame.draw.rect(surf, CARD_BORDER, self.rect, 2, border_radius=6)
-        txt = self.font.render(self.text, True, TEXT_COLOR if self.enabled else (100, 100, 100))
-        txt_r = txt.get_rect(center=self.rect.center)
+        rect, font, radius, border = self.rect, self.font, 6, 2
+        if view is not None:
+            rect, font = view.rect(self.rect), view.font(self.font)
+            radius, border = view.length(6), view.length(2)
+        pygame.draw.rect(surf, color, rect, border_radius=radius)
+        pygame.draw.rect(surf, CARD_BORDER, rect, border, border_radius=radius)
+        txt = render_text(font, self.text, True, TEXT_COLOR if self.enabled else (100, 100, 100))
+        txt_r = txt.get_rect(center=rect.center)
         surf.blit(txt, txt_r)
 
     def clicked(self, event):
@@ -1,21 +1,122 @@
 import pygame
 
+
+def linear(t):
+    return t
+
+
+def ease_out_cubic(t):
+    # Sai rápido do baralho e desacelera ao chegar na mão
+    return 1 - (1 - t) ** 3
+
+
 class CardSprite:
-    def __init__(self, image, start_pos, target_pos, speed=10):
+    """
+    Image moving from start_pos to target_pos in `duration` seconds.
+
+    The position is a function of elapsed time (not of frame count), so the
+    animation takes the same time at any frame rate and a dropped frame just
+    jumps ahead. `delay` holds the sprite hidden at the start before it moves.
+    """
+
+    def __init__(self, image, start_pos, target_pos, duration=0.3, delay=0.0, easing=ease_out_cubic,
+                 layer=0, key=None):
         self.image = image
+        self.start = pygame.Vector2(start_pos)
         self.pos = pygame.Vector2(start_pos)
         self.target = pygame.Vector2(target_pos)
-        self.speed = speed  # pixels per frame
+        self.duration = duration
+        self.delay = delay
+        self.easing = easing
+        self.layer = layer
+        self.key = key  # identifica o destino (ex.: a carta na mão), opcional
+        self.elapsed = 0.0
         self.done = False
 
-    def update(self):
-        if not self.done:
-            direction = self.target - self.pos
-            if direction.length() < self.speed:
-                self.pos = self.target
-                self.done = True
-            else:
-                self.pos += direction.normalize() * self.speed
-
-    def draw(self, surf):
-        surf.blit(self.image, self.pos)
+    @property
+    def visible(self):
+        return self.elapsed >= self.delay
+
+    @property
+    def rect(self):
+        return pygame.Rect(self.pos, self.image.get_size())
+
+    def update(self, dt):
+        if self.done:
+            return
+        self.elapsed += dt
+        t = (self.elapsed - self.delay) / self.duration if self.duration > 0 else 1.0
+        if t >= 1:
+            self.pos = pygame.Vector2(self.target)
+            self.done = True
+        elif t > 0:
+            self.pos = self.start.lerp(self.target, self.easing(t))
+
+    def draw(self, surf, view=None):
+        if not self.visible:
+            return
+        if view is None:
+            surf.blit(self.image, self.pos)
+        else:
+            view.blit(surf, self.image, self.pos)
+
+
+class SpriteGroup:
+    """
+    The moving sprites of a scene, updated and drawn as one batch.
+
+    update(dt) advances every sprite, drops the finished ones in a single
+    pass and returns the rects that changed; draw() paints in layer order.
+    add(sprite, stagger) queues sprites so that bursts (the four cards of a
+    deal, several dealer draws) leave the deck one after another.
+    """
+
+    def __init__(self):
+        self.sprites = []
+        self.clock = 0.0
+        self.next_start = 0.0
+
+    def __len__(self):
+        return len(self.sprites)
+
+    def __bool__(self):
+        return bool(self.sprites)
+
+    def __iter__(self):
+        return iter(self.sprites)
+
+    def add(self, sprite, stagger=0.0):
+        sprite.delay += max(0.0, self.next_start - self.clock)
+        self.next_start = self.clock + sprite.delay + stagger
+        self.sprites.append(sprite)
+        # Ordem estável por camada: insere mantendo a ordem de chegada
+        self.sprites.sort(key=lambda s: s.layer)
+        return sprite
+
+    def keys(self):
+        """Keys of sprites still moving or waiting, e.g. cards not yet landed."""
+        return {sprite.key for sprite in self.sprites}
+
+    def update(self, dt):
+        """Advance all sprites by dt seconds; returns the dirty rects (old and new position)."""
+        self.clock += dt
+        dirty = []
+        for sprite in self.sprites:
+            was_visible = sprite.visible
+            old_rect = sprite.rect
+            sprite.update(dt)
+            if was_visible or sprite.visible:
+                dirty.append(old_rect.union(sprite.rect) if was_visible else sprite.rect)
+        # Os que chegaram saem já neste quadro (a carta fica na mão)
+        self.sprites = [sprite for sprite in self.sprites if not sprite.done]
+        if not self.sprites:
+            self.clock = self.next_start = 0.0
+        return dirty
+
+    def draw(self, surf, view=None):
+        for sprite in self.sprites:
+            sprite.draw(surf, view)
+
+    def clear(self):
+        self.sprites = []
+        self.clock = self.next_start = 0.0
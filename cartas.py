@@ -2,62 +2,248 @@ import random
 from Configs import RANKS, SUITS, VALUES
 
 class Card:
-    def __init__(self, rank, suit):
-        self.rank = rank
-        self.suit = suit
+    """
+    Interned playing card: there is exactly one instance per (rank, suit),
+    so Card('ace', '♠') always returns the same object. `code` indexes CARDS
+    and is what Deck stores in its byte array.
+    """
+    __slots__ = ('rank', 'suit', 'rank_code', 'suit_code', 'code', 'points')
+
+    _interned = {}
+
+    def __new__(cls, rank, suit):
+        card = cls._interned.get((rank, suit))
+        if card is None:
+            raise ValueError(f"unknown card {rank!r} of {suit!r}")
+        return card
+
+    @classmethod
+    def _make(cls, rank_code, suit_code):
+        card = object.__new__(cls)
+        card.rank = RANKS[rank_code]
+        card.suit = SUIT_SYMBOLS[suit_code]
+        card.rank_code = rank_code
+        card.suit_code = suit_code
+        card.code = suit_code * len(RANKS) + rank_code
+        card.points = VALUES[card.rank]
+        cls._interned[(card.rank, card.suit)] = card
+        return card
+
+    def __reduce__(self):
+        return (Card, (self.rank, self.suit))
 
     def value(self):
-        return VALUES[self.rank]
+        return self.points
 
     def is_ace(self):
-        return self.rank == 'ace'
+        return self.rank_code == 0
+
+    def label(self):
+        # Ex.: "10H", "KS"; texto simples, sem depender de glifos de naipe
+        rank = self.rank if self.rank == '10' else self.rank[0].upper()
+        return rank + SUITS[self.suit][0]
 
     def __repr__(self):
         return f"{self.rank}{self.suit}"
 
+
+SUIT_SYMBOLS = tuple(SUITS)
+# CARDS[code] -> Card, na mesma ordem em que um baralho novo é montado
+CARDS = tuple(Card._make(r, s) for s in range(len(SUIT_SYMBOLS)) for r in range(len(RANKS)))
+FULL_DECK = bytes(range(len(CARDS)))
+# RANK_OF[code] -> rank_code, para contar sem passar pelo objeto Card
+RANK_OF = tuple(card.rank_code for card in CARDS)
+
+
+class CountSystem:
+    """
+    Card-counting tags indexed by rank_code (ace first). Balanced systems
+    start at 0; unbalanced ones (KO) start at pivot minus the tags of the
+    whole shoe, the usual initial running count.
+    """
+    __slots__ = ('name', 'tags', 'pivot', 'by_code')
+
+    def __init__(self, name, tags, pivot=0):
+        self.name = name
+        self.tags = tuple(tags)
+        self.pivot = pivot
+        # Tag de cada código de carta, para draw() somar direto
+        self.by_code = tuple(self.tags[rank] for rank in RANK_OF)
+
+    def initial(self, num_decks):
+        return self.pivot - sum(self.tags) * len(SUIT_SYMBOLS) * num_decks
+
+    def __repr__(self):
+        return f"CountSystem({self.name!r})"
+
+
+# Tags na ordem de RANKS: A, 2..10, J, Q, K
+COUNT_SYSTEMS = {
+    'hilo': CountSystem('Hi-Lo', (-1, 1, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1)),
+    'ko': CountSystem('KO', (-1, 1, 1, 1, 1, 1, 1, 0, 0, -1, -1, -1, -1), pivot=4),
+    'omega2': CountSystem('Omega II', (0, 1, 1, 2, 2, 2, 1, 0, -1, -2, -2, -2, -2)),
+}
+
+
 class Deck:
-    def __init__(self, num_decks=1):
-        self.cards = []
-        for _ in range(num_decks):
-            for s in SUITS:
-                for r in RANKS:
-                    self.cards.append(Card(r, s))
+    """
+    Besides the cards, keeps how many of each rank are left (rank_counts,
+    by rank_code) and the running count of `count_system`, both updated on
+    every draw, so the composition and the counts are read in constant time
+    instead of scanning the remaining cards.
+    """
+
+    def __init__(self, num_decks=1, rng=None, count_system='hilo'):
+        self.num_decks = num_decks
+        # Shoe pré-alocado com o código de cada carta (índice em CARDS).
+        # As cartas restantes são shoe[:remaining]; draw tira do fim.
+        self.shoe = bytearray(FULL_DECK * num_decks)
+        self.remaining = len(self.shoe)
+        # rng: random.Random próprio para simulações reproduzíveis
+        self.rng = rng if rng is not None else random
+        self.rank_counts = [len(SUIT_SYMBOLS) * num_decks] * len(RANKS)
+        self.count_system = None
+        self.set_count_system(count_system)
         self.shuffle()
 
+    # --------- Contagem ---------
+    def set_count_system(self, system):
+        """Switch the tracked system (a COUNT_SYSTEMS key or a CountSystem) mid-shoe."""
+        system = COUNT_SYSTEMS[system] if isinstance(system, str) else system
+        self.running = self.running_count(system)
+        self.count_system = system
+        self._tags = system.by_code
+
+    def _reset_counts(self):
+        self.rank_counts = [len(SUIT_SYMBOLS) * self.num_decks] * len(RANKS)
+        self.running = self.count_system.initial(self.num_decks)
+
+    def running_count(self, system=None):
+        """Running count of the tracked system, or of any other one from rank_counts (13 steps)."""
+        if system is None or system is self.count_system:
+            return self.running
+        system = COUNT_SYSTEMS[system] if isinstance(system, str) else system
+        full = len(SUIT_SYMBOLS) * self.num_decks
+        return system.initial(self.num_decks) + sum(
+            tag * (full - left) for tag, left in zip(system.tags, self.rank_counts))
+
+    def decks_remaining(self):
+        return self.remaining / len(CARDS)
+
+    def true_count(self, system=None):
+        """Running count per deck still in the shoe."""
+        if not self.remaining:
+            return 0.0
+        return self.running_count(system) / self.decks_remaining()
+
+    def composition(self):
+        """Remaining cards by point value, as dealer_odds.composition(): aces first, tens last."""
+        counts = self.rank_counts
+        return tuple(counts[:9]) + (sum(counts[9:]),)
+
+    @property
+    def cards(self):
+        return memoryview(self.shoe)[:self.remaining]
+
+    def __len__(self):
+        return self.remaining
+
     def shuffle(self):
-        random.shuffle(self.cards)
+        # Recolhe as cartas já usadas e embaralha no mesmo buffer
+        self.remaining = len(self.shoe)
+        self._reset_counts()
+        self.rng.shuffle(self.shoe)
+
+    def needs_shuffle(self):
+        return False
 
     def draw(self):
-        if not self.cards:
-            self.__init__()
-        return self.cards.pop()
+        if not self.remaining:
+            self.shuffle()
+        self.remaining -= 1
+        code = self.shoe[self.remaining]
+        self.rank_counts[RANK_OF[code]] -= 1
+        self.running += self._tags[code]
+        return CARDS[code]
+
+
+class Shoe(Deck):
+    """
+    Multi-deck shoe with a cut card. Once fewer than (1 - penetration) of the
+    cards are left, needs_shuffle() asks for a reshuffle before the next
+    round. With continuous=True it behaves like a continuous shuffler: every
+    round starts from the full shoe and each draw picks a random remaining
+    card, so there is no shuffle pass at all.
+    """
+
+    def __init__(self, num_decks=6, penetration=0.75, continuous=False, rng=None, count_system='hilo'):
+        self.penetration = penetration
+        self.continuous = continuous
+        super().__init__(num_decks, rng, count_system)
+        self.cut_card = len(self.shoe) - int(len(self.shoe) * penetration)
+
+    def needs_shuffle(self):
+        return self.continuous or self.remaining <= self.cut_card
+
+    def shuffle(self):
+        if self.continuous:
+            self.remaining = len(self.shoe)
+            self._reset_counts()
+        else:
+            super().shuffle()
+
+    def draw(self):
+        if not self.remaining:
+            self.shuffle()
+        self.remaining -= 1
+        shoe = self.shoe
+        if self.continuous:
+            # Fisher-Yates preguiçoso: troca uma carta sorteada para o fim
+            j = self.rng.randrange(self.remaining + 1)
+            shoe[j], shoe[self.remaining] = shoe[self.remaining], shoe[j]
+        code = shoe[self.remaining]
+        self.rank_counts[RANK_OF[code]] -= 1
+        self.running += self._tags[code]
+        return CARDS[code]
+
 
 class Hand:
+    """
+    Keeps a running hard total (aces as 1) and whether an ace is held, so
+    every query below is a constant-time read instead of a rescan of cards.
+    """
+
     def __init__(self):
         self.cards = []
+        self.hard = 0
+        self.has_ace = False
+        self._values = [0]
 
     def add(self, card):
         self.cards.append(card)
+        self.hard += card.points
+        self.has_ace = self.has_ace or card.rank_code == 0
+        # Só um ás pode valer 11 sem estourar
+        if self.has_ace and self.hard + 10 <= 21:
+            self._values = [self.hard + 10, self.hard]
+        else:
+            self._values = [self.hard]
 
     def values(self):
-        total = sum(card.value() for card in self.cards)
-        aces = sum(1 for card in self.cards if card.is_ace())
-        totals = {total}
-        for _ in range(aces):
-            new_totals = set()
-            for t in totals:
-                new_totals.add(t + 10)
-            totals |= new_totals
-        return sorted([t for t in totals if t <= 21], reverse=True) or [min(totals)]
+        # Cópia: quem chama pode mexer na lista sem estragar o total da mão
+        return list(self._values)
 
     def best_value(self):
-        return self.values()[0]
+        return self._values[0]
+
+    def is_soft(self):
+        return len(self._values) == 2
 
     def is_blackjack(self):
-        return len(self.cards) == 2 and 21 in self.values()
+        return len(self.cards) == 2 and self._values[0] == 21
 
     def is_bust(self):
-        return all(v > 21 for v in self.values())
+        return self.hard > 21
 
     def clear(self):
-        self.cards = []
\ No newline at end of file
+        self.__init__()
@@ -0,0 +1,252 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from Configs import BASE_DIR, RANKS, VALUES
+from dealer_odds import dealer_probabilities
+from solver import _Table
+from strategy import Strategy, default_table, cell, HARD, SOFT, PAIR, UP_ORDER
+
+CACHE_DIR = os.path.join(BASE_DIR, ".cache", "charts")
+# Muda quando o cálculo muda: invalida os charts em cache
+CHART_VERSION = 1
+
+# Regras da mesa (RoundEngine / Game): dealer para em todo 17, blackjack paga 3:2,
+# double em quaisquer duas cartas (também depois do split), um só split e só de
+# ranks iguais (Q + 10 não separa), cada mão do split segue com hit/stand/double
+TABLE_RULES = {
+    'decks': 4,
+    'hit_soft_17': False,
+    'double_after_split': True,
+    'blackjack_pays': 1.5,
+    'split_by_rank': True,
+}
+
+RANK_POINTS = [VALUES[rank] for rank in RANKS]
+
+
+def normalize(rules=None):
+    """TABLE_RULES overridden by `rules`; unknown keys are an error."""
+    rules = dict(rules or {})
+    unknown = set(rules) - set(TABLE_RULES)
+    if unknown:
+        raise ValueError(f"unknown rule(s): {', '.join(sorted(unknown))}")
+    return dict(TABLE_RULES, **rules)
+
+
+def rules_key(rules):
+    """Hash of a rule set (and of CHART_VERSION): the cache file name."""
+    text = json.dumps(dict(rules, version=CHART_VERSION), sort_keys=True)
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def initial_hands(decks, split_by_rank=True):
+    """
+    {(up, low, high, can_split): probability} for every up-card and player
+    two-card hand (card points, ace = 1), dealt by rank from a full shoe so
+    that pairs of tens can be told apart the way Player.can_split does.
+    """
+    counts = [4 * decks] * len(RANKS)
+    total = sum(counts)
+    hands = {}
+    for u in range(len(RANKS)):
+        p_up = counts[u] / total
+        counts[u] -= 1
+        for a in range(len(RANKS)):
+            p_a = p_up * counts[a] / (total - 1)
+            counts[a] -= 1
+            for b in range(len(RANKS)):
+                p = p_a * counts[b] / (total - 2)
+                va, vb = RANK_POINTS[a], RANK_POINTS[b]
+                pair = a == b if split_by_rank else va == vb
+                key = (RANK_POINTS[u], min(va, vb), max(va, vb), pair)
+                hands[key] = hands.get(key, 0.0) + p
+            counts[a] += 1
+        counts[u] += 1
+    return hands
+
+
+def unseen(decks, *removed):
+    """Composition by points (dealer_odds order) of a full shoe without `removed`."""
+    comp = [4 * decks] * 9 + [16 * decks]
+    for points in removed:
+        comp[points - 1] -= 1
+    return tuple(comp)
+
+
+def _code(values):
+    # Melhor entre hit/stand/double, no código de uma célula do chart
+    best = max(('stand', 'hit', 'double'), key=values.get)
+    if best == 'double':
+        return 'D' if values['hit'] >= values['stand'] else 'T'
+    return 'H' if best == 'hit' else 'S'
+
+
+def solve(rules):
+    """
+    Basic strategy chart and house edge for `rules` (see TABLE_RULES).
+
+    Every up-card and two-card hand is solved with the composition that is
+    left after those three cards (solver._Table, dealer_odds DP). A hard or
+    soft row cell takes the action with the best EV averaged over the hands
+    with that total, weighted by how often they are dealt; a pair cell
+    splits when splitting beats the best other action. The house edge is
+    the EV of the whole round played by the chart, naturals included.
+    """
+    decks = rules['decks']
+    hands = initial_hands(decks, rules['split_by_rank'])
+    solved = {}
+    totals = {}
+    pairs = {}
+    for (up, low, high, can_split), p in hands.items():
+        if low == 1 and high == 10:
+            continue
+        key = (up, low, high)
+        if key not in solved:
+            comp = unseen(decks, up, low, high)
+            evs = _Table(up, comp, rules['hit_soft_17'], rules['blackjack_pays'])
+            hard, has_ace = low + high, low == 1
+            values = {'stand': evs.stand(hard, has_ace), 'hit': evs.hit(hard, has_ace),
+                      'double': evs.double(hard, has_ace)}
+            if low == high:
+                values['split'] = evs.split(low, rules['double_after_split'])
+            p_bj = dealer_probabilities(up, comp, rules['hit_soft_17'])['blackjack']
+            solved[key] = (p_bj, values)
+        p_bj, values = solved[key]
+        # Só importa quando o dealer não tem blackjack (senão a rodada acaba no deal)
+        weight = p * (1 - p_bj)
+        soft = low == 1 and low + high + 10 <= 21
+        row = (SOFT, low + high + 10) if soft else (HARD, low + high)
+        sums = totals.setdefault(row + (up,), dict.fromkeys(('stand', 'hit', 'double'), 0.0))
+        for action in sums:
+            sums[action] += weight * values[action]
+        if can_split:
+            others = max(values['stand'], values['hit'], values['double'])
+            pairs[(low, up)] = 'P' if values['split'] > others else '-'
+
+    table = default_table()
+    for (category, total, up), sums in totals.items():
+        table[cell(category, total, up)] = ord(_code(sums))
+    for (points, up), code in pairs.items():
+        table[cell(PAIR, points, up)] = ord(code)
+    strategy = Strategy(table, strategy_name(rules))
+
+    # Vantagem da casa jogando o chart (não a melhor ação de cada mão)
+    ev = 0.0
+    for (up, low, high, can_split), p in hands.items():
+        if low == 1 and high == 10:
+            comp = unseen(decks, up, low, high)
+            p_bj = dealer_probabilities(up, comp, rules['hit_soft_17'])['blackjack']
+            ev += p * (1 - p_bj) * rules['blackjack_pays']
+            continue
+        p_bj, values = solved[(up, low, high)]
+        if can_split and table[cell(PAIR, low, up)] == ord('P'):
+            action = 'split'
+        else:
+            soft = low == 1 and low + high + 10 <= 21
+            code = chr(table[cell(SOFT, low + high + 10, up) if soft else cell(HARD, low + high, up)])
+            action = {'H': 'hit', 'S': 'stand', 'D': 'double', 'T': 'double'}[code]
+        ev += p * ((1 - p_bj) * values[action] - p_bj)
+    return strategy, -ev
+
+
+def strategy_name(rules):
+    name = f"basic_{rules['decks']}d_{'h17' if rules['hit_soft_17'] else 's17'}"
+    if rules['double_after_split']:
+        name += "_das"
+    if rules['blackjack_pays'] != 1.5:
+        name += f"_bj{rules['blackjack_pays']:g}"
+    if not rules['split_by_rank']:
+        name += "_splitvalue"
+    return name
+
+
+def chart_rows(strategy):
+    """{'h16': 'SSSSSHHHHH', ...}: hard 4-21, soft 12-21 and pairs, cells for dealer 2..10, A."""
+    rows = {}
+    for prefix, category, totals in (('h', HARD, range(4, 22)), ('s', SOFT, range(12, 22)), ('p', PAIR, range(1, 11))):
+        for total in totals:
+            label = 'T' if category == PAIR and total == 10 else str(total)
+            rows[prefix + label] = "".join(chr(strategy.table[cell(category, total, up)]) for up in UP_ORDER)
+    return rows
+
+
+def chart(rules=None, refresh=False, cache_dir=CACHE_DIR):
+    """
+    Basic strategy for `rules` as a dict: rules, key, name, house_edge,
+    rows (see chart_rows), seconds and cached. Results are stored in
+    `cache_dir` under the hash of the rules, so a rule set is solved once.
+    """
+    rules = normalize(rules)
+    key = rules_key(rules)
+    path = os.path.join(cache_dir, key + ".json") if cache_dir else None
+    if path and not refresh:
+        try:
+            with open(path) as f:
+                result = json.load(f)
+            if result.get("rules") == rules:
+                result["cached"] = True
+                return result
+        except (OSError, ValueError):
+            pass
+
+    start = time.perf_counter()
+    strategy, edge = solve(rules)
+    result = {"rules": rules, "key": key, "name": strategy.name, "house_edge": edge,
+              "rows": chart_rows(strategy), "seconds": time.perf_counter() - start}
+    if path:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(result, f, indent=1)
+        os.replace(tmp, path)
+    result["cached"] = False
+    return result
+
+
+def to_strategy(result):
+    """Strategy (strategy.py) playing a chart() result."""
+    table = default_table()
+    categories = {'h': HARD, 's': SOFT, 'p': PAIR}
+    for label, cells in result["rows"].items():
+        total = 10 if label[1:] == 'T' else int(label[1:])
+        for up, code in zip(UP_ORDER, cells):
+            table[cell(categories[label[0]], total, up)] = ord(code)
+    return Strategy(table, result["name"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Basic strategy chart and house edge for a rule set (cached on disk).")
+    parser.add_argument("--decks", type=int, default=TABLE_RULES['decks'])
+    parser.add_argument("--h17", action="store_true", help="dealer hits soft 17 (the table stands on all 17s)")
+    parser.add_argument("--no-das", action="store_true", help="no double after split")
+    parser.add_argument("--blackjack-pays", type=float, default=TABLE_RULES['blackjack_pays'],
+                        help="natural payout per unit bet (1.5 = 3:2, 1.2 = 6:5)")
+    parser.add_argument("--split-by-value", action="store_true",
+                        help="any two ten-valued cards split (the table needs equal ranks, Q + 10 does not split)")
+    parser.add_argument("--refresh", action="store_true", help="solve again even if the rule set is cached")
+    parser.add_argument("--emit", metavar="PATH", help="write the chart in the strategy file format (strategy.py)")
+    args = parser.parse_args()
+    if args.decks < 1:
+        parser.error("--decks must be at least 1")
+
+    result = chart({'decks': args.decks, 'hit_soft_17': args.h17, 'double_after_split': not args.no_das,
+                    'blackjack_pays': args.blackjack_pays, 'split_by_rank': not args.split_by_value},
+                   refresh=args.refresh)
+
+    source = "cached" if result["cached"] else f"solved in {result['seconds']:.1f}s"
+    print(f"{result['name']}  ({result['key']}, {source})")
+    print(f"{'':5}" + " ".join(f"{up:>2}" for up in "2 3 4 5 6 7 8 9 T A".split()))
+    for label, cells in result["rows"].items():
+        print(f"{label:<5}" + " ".join(f"{c:>2}" for c in cells))
+    print(f"house edge: {result['house_edge']:.3%}")
+    if args.emit:
+        to_strategy(result).save(args.emit)
+        print(f"Strategy written to {args.emit}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+from functools import lru_cache
+from cartas import CARDS
+
+# Ordem dos resultados nas tuplas de probabilidade
+OUTCOMES = (17, 18, 19, 20, 21, 'bust', 'blackjack')
+BUST = 5
+BLACKJACK = 6
+
+
+def composition(cards):
+    """
+    Count remaining cards by point value: index 0 is aces, 9 is tens/faces.
+    Accepts a Deck (read from its live rank counts) or any iterable of Card.
+    """
+    if hasattr(cards, 'rank_counts'):
+        return cards.composition()
+    counts = [0] * 10
+    for c in getattr(cards, 'cards', cards):
+        card = CARDS[c] if isinstance(c, int) else c
+        counts[card.points - 1] += 1
+    return tuple(counts)
+
+
+def _bucket(hard, has_ace, n_cards, hit_soft_17=False):
+    """Index in OUTCOMES when the dealer stops here, None while it must hit."""
+    best = hard + 10 if has_ace and hard + 10 <= 21 else hard
+    if n_cards == 2 and best == 21:
+        return BLACKJACK
+    if hard > 21:
+        return BUST
+    # Dealer.should_hit: compra abaixo de 17, para em qualquer 17 (ou compra no soft 17 com H17)
+    if best >= 17 and not (hit_soft_17 and best == 17 and best != hard):
+        return best - 17
+    return None
+
+
+# Um shoe gera uns 5 mil estados; RoundEngine limpa o cache a cada embaralhada
+@lru_cache(maxsize=1 << 13)
+def _dealer(hard, has_ace, n_cards, comp, hit_soft_17=False):
+    remaining = sum(comp)
+    probs = [0.0] * len(OUTCOMES)
+    if not remaining:
+        return tuple(probs)
+    n_next = min(n_cards + 1, 3)
+    for i, count in enumerate(comp):
+        if not count:
+            continue
+        weight = count / remaining
+        next_hard = hard + i + 1
+        next_ace = has_ace or i == 0
+        # Cartas que encerram a mão vão direto para o resultado, sem recursão
+        bucket = _bucket(next_hard, next_ace, n_next, hit_soft_17)
+        if bucket is not None:
+            probs[bucket] += weight
+            continue
+        rest = comp[:i] + (count - 1,) + comp[i + 1:]
+        sub = _dealer(next_hard, next_ace, n_next, rest, hit_soft_17)
+        for k, p in enumerate(sub):
+            probs[k] += weight * p
+    return tuple(probs)
+
+
+def dealer_probabilities(upcard, comp, hit_soft_17=False):
+    """
+    Exact distribution of the dealer's final hand given the up-card and the
+    composition of the unseen cards (the hole card is drawn from `comp` too).
+    The table's dealer stands on all 17s; `hit_soft_17` is the H17 variant.
+
+    `upcard` is a Card or a point value (1 = ace); `comp` is a 10-tuple as
+    returned by composition(). Returns {17..21, 'bust', 'blackjack': p}.
+    Results are memoized by composition, so repeated queries during a shoe
+    only pay for the states they have not seen yet.
+    """
+    points = getattr(upcard, 'points', upcard)
+    probs = _dealer(points, points == 1, 1, tuple(comp), hit_soft_17)
+    return dict(zip(OUTCOMES, probs))
+
+
+def clear_cache():
+    _dealer.cache_clear()
@@ -0,0 +1,360 @@
+from cartas import Shoe
+from player import Player, Dealer
+from dealer_odds import clear_cache
+
+# --------- Resultados por mão ---------
+LOSE = 'lose'
+WIN = 'win'
+BLACKJACK = 'blackjack'
+PUSH = 'push'
+DEALER_BLACKJACK = 'dealer_blackjack'
+
+ACTION_CODES = {'hit': 'H', 'stand': 'S', 'split': 'P', 'double': 'D'}
+
+
+class Wallet:
+    """Headless stand-in for bank.Bank: same amount/bet fields, no pygame, no disk."""
+
+    def __init__(self, initial_amount=1000, bet=10):
+        self.amount = initial_amount
+        self.bet = bet
+        self.min_bet = 1
+        self.max_bet = self.amount
+
+    def place_bet(self, amount=None):
+        stake = self.bet if amount is None else amount
+        if stake > self.amount:
+            return False
+        self.amount -= stake
+        return True
+
+    def payout(self, multiplier=2, stake=None):
+        self.amount += int((self.bet if stake is None else stake) * multiplier)
+
+
+def hand_outcome(hand, dealer_hand):
+    """Result label for one player hand against the dealer's final hand."""
+    if hand.is_bust():
+        return LOSE
+    if dealer_hand.is_bust():
+        return WIN
+    if hand.is_blackjack() and not dealer_hand.is_blackjack():
+        return BLACKJACK
+    if dealer_hand.is_blackjack() and not hand.is_blackjack():
+        return DEALER_BLACKJACK
+    p_best = hand.best_value()
+    d_best = dealer_hand.best_value()
+    if p_best > d_best:
+        return WIN
+    if p_best < d_best:
+        return LOSE
+    return PUSH
+
+
+def hand_payout(hand, dealer_hand):
+    """Payout multiplier (applied to the hand's stake) once the dealer has played."""
+    if hand.is_bust():
+        return 0
+    p_best = hand.best_value()
+    d_best = dealer_hand.best_value()
+    if dealer_hand.is_bust() or p_best > d_best:
+        return 2
+    if hand.is_blackjack() and not dealer_hand.is_blackjack():
+        return 2.5
+    if p_best == d_best:
+        return 1
+    return 0
+
+
+OUTCOME_TEXT = {
+    LOSE: "Dealer wins.",
+    WIN: "Player wins!",
+    BLACKJACK: "Blackjack! Player wins!",
+    PUSH: "Push (tie).",
+    DEALER_BLACKJACK: "Dealer has Blackjack! You lose.",
+}
+
+
+class RoundEngine:
+    """
+    Round rules without any pygame dependency.
+
+    Drives the same Deck/Hand/Player/Dealer objects the table uses and takes
+    actions programmatically (deal/hit/stand/split/double). `jogo.Game` is a
+    view over this class; simulations can use it directly with a `Wallet`.
+
+    Hooks (optional callables):
+     - on_card(target, hand_index, card_index, card, phase): every card dealt,
+       phase is one of 'deal', 'hit', 'split', 'double', 'dealer'
+     - on_round_end(result): after the dealer plays and hands are paid
+     - on_settled(engine): after every finished round, naturals included
+     - on_action(action): an accepted 'deal'/'hit'/'stand'/'split'/'double',
+       fired before any card of that action is drawn
+
+    `actions` holds the player's moves this round as ACTION_CODES letters;
+    `returned` is what the wallet got back, so the round's net is
+    returned - sum(bets).
+    """
+
+    def __init__(self, deck=None, wallet=None):
+        self.deck = deck if deck is not None else Shoe(num_decks=4)
+        self.wallet = wallet if wallet is not None else Wallet()
+        self.player = Player()
+        self.dealer = Dealer()
+        self.state = 'idle'
+        self.message = 'Click DEAL to start'
+        self.bets = []
+        self.doubled = []
+        self.outcomes = []
+        self.actions = []
+        self.returned = 0
+        self.stake = 0
+        self.initial_cards = ()
+        self.on_card = None
+        self.on_round_end = None
+        self.on_settled = None
+        self.on_action = None
+
+    # --------- Cartas ---------
+    def _draw_to(self, hand, target, hand_index, phase):
+        # Quem chama já tem a mão; target/hand_index só servem ao hook
+        card = self.deck.draw()
+        hand.add(card)
+        if self.on_card is not None:
+            self.on_card(target, hand_index, len(hand.cards) - 1, card, phase)
+        return card
+
+    # --------- Estado das ações ---------
+    def can_deal(self):
+        return self.state in ('idle', 'round_over')
+
+    def can_hit(self):
+        return self.state == 'playing'
+
+    can_stand = can_hit
+
+    def can_split(self):
+        return (self.state == 'playing'
+                and self.player.can_split()
+                and self.wallet.amount >= self.bets[0])
+
+    def can_double(self):
+        if self.state != 'playing':
+            return False
+        i = self.player.current_hand
+        return (not self.doubled[i]
+                and len(self.player.hands[i].cards) == 2
+                and self.wallet.amount >= self.bets[i])
+
+    # --------- Ações ---------
+    def deal(self):
+        if not self.can_deal():
+            return False
+        # Deduct bet first
+        if not self.wallet.place_bet():
+            self.message = "Not enough money to bet!"
+            return False
+        self._acted('deal')
+
+        # Cut card reached: reshuffle between rounds, never mid-hand
+        if self.deck.needs_shuffle():
+            self.deck.shuffle()
+            # Composições do shoe anterior não voltam: libera as probabilidades em cache
+            clear_cache()
+
+        self.player.reset()
+        self.dealer.reset()
+        self.stake = self.wallet.bet
+        self.bets = [self.stake]
+        self.doubled = [False]
+        self.outcomes = []
+        self.actions = []
+        self.returned = 0
+        self.state = 'playing'
+        self.message = ''
+
+        # Deal cards in order: player, dealer, player, dealer
+        player_hand = self.player.hands[0]
+        dealer_hand = self.dealer.hands[0]
+        if self.on_card is None:
+            # Sem hook (simulações): só as cartas
+            draw = self.deck.draw
+            player_hand.add(draw())
+            dealer_hand.add(draw())
+            player_hand.add(draw())
+            dealer_hand.add(draw())
+        else:
+            self._draw_to(player_hand, 'player', 0, 'deal')
+            self._draw_to(dealer_hand, 'dealer', 0, 'deal')
+            self._draw_to(player_hand, 'player', 0, 'deal')
+            self._draw_to(dealer_hand, 'dealer', 0, 'deal')
+        self.initial_cards = tuple(player_hand.cards)
+
+        # Check for Blackjack immediately
+        player_blackjack = player_hand.is_blackjack()
+        dealer_blackjack = dealer_hand.is_blackjack()
+        if player_blackjack or dealer_blackjack:
+            if player_blackjack and dealer_blackjack:
+                self.message = 'Push: both have Blackjack'
+                self.outcomes = [PUSH]
+                self._pay(1, self.bets[0])
+            elif player_blackjack:
+                self.message = 'Blackjack! You win!'
+                self.outcomes = [BLACKJACK]
+                self._pay(2.5, self.bets[0])
+            else:
+                self.message = 'Dealer has Blackjack! You lose.'
+                self.outcomes = [DEALER_BLACKJACK]
+            self.state = 'round_over'
+            self._settled()
+        return True
+
+    def hit(self):
+        if not self.can_hit():
+            return False
+        i = self.player.current_hand
+        self._acted('hit')
+        hand = self.player.hands[i]
+        self._draw_to(hand, 'player', i, 'hit')
+
+        if hand.is_bust():
+            self.message = f'Hand {i + 1} busted!'
+            # Avança para próxima mão, se houver
+            if i + 1 < len(self.player.hands):
+                self.player.current_hand += 1
+                self.message += f' Playing hand {self.player.current_hand + 1}.'
+            else:
+                self.message += ' All hands played.'
+                self.state = 'player_stand'
+                self.dealer_play()
+        elif hand.best_value() == 21:
+            self._next_hand()
+        return True
+
+    def stand(self):
+        if not self.can_stand():
+            return False
+        self._acted('stand')
+        self._next_hand()
+        return True
+
+    def _acted(self, action):
+        if action != 'deal':
+            self.actions.append(ACTION_CODES[action])
+        if self.on_action is not None:
+            self.on_action(action)
+
+    def _next_hand(self):
+        # Avança para próxima mão, se houver
+        if self.player.current_hand + 1 < len(self.player.hands):
+            self.player.current_hand += 1
+            self.message = f'Playing hand {self.player.current_hand + 1} of {len(self.player.hands)}'
+        else:
+            self.state = 'player_stand'
+            self.dealer_play()
+
+    def split(self):
+        if self.state != 'playing':
+            return False
+        if not self.player.can_split():
+            self.message = 'Cannot split these cards.'
+            return False
+        # require enough money for another bet
+        if not self.wallet.place_bet(self.bets[0]):
+            self.message = 'Not enough money to split!'
+            return False
+
+        self._acted('split')
+        self.player.split()
+        self.bets.append(self.bets[0])
+        self.doubled = [False] * len(self.player.hands)
+        # draw one card for each split hand
+        self._draw_to(self.player.hands[0], 'player', 0, 'split')
+        self._draw_to(self.player.hands[1], 'player', 1, 'split')
+        self.message = 'Split done: playing first hand'
+        return True
+
+    def double(self):
+        if self.state != 'playing':
+            return False
+        i = self.player.current_hand
+        hand = self.player.hands[i]
+
+        # Only allow double once per hand
+        if self.doubled[i]:
+            self.message = "You already doubled this hand!"
+            return False
+        # Only allowed with exactly two cards
+        if len(hand.cards) != 2:
+            self.message = "You can only double on your first two cards!"
+            return False
+        # Deduct additional bet
+        if not self.wallet.place_bet(self.bets[i]):
+            self.message = "Not enough money to double!"
+            return False
+
+        self._acted('double')
+        self.bets[i] *= 2
+        self.doubled[i] = True
+        self._draw_to(hand, 'player', i, 'double')
+
+        if hand.is_bust():
+            self.message = f"Hand {i + 1} busted after double!"
+        else:
+            self.message = f"Hand {i + 1} doubled down."
+
+        # If more hands remain, move to the next one
+        if i + 1 < len(self.player.hands):
+            self.player.current_hand += 1
+            self.message += f" Playing hand {self.player.current_hand + 1}."
+        else:
+            self.state = 'player_stand'
+            self.dealer_play()
+        return True
+
+    def play(self, action):
+        """Dispatch an action by name: 'deal', 'hit', 'stand', 'split' or 'double'."""
+        return getattr(self, action)()
+
+    # --------- Dealer e pagamento ---------
+    def dealer_play(self):
+        dealer_hand = self.dealer.hands[0]
+        while not dealer_hand.is_bust() and self.dealer.should_hit():
+            self._draw_to(dealer_hand, 'dealer', 0, 'dealer')
+        self.end_round()
+
+    def end_round(self):
+        self.state = 'round_over'
+        dealer_hand = self.dealer.hands[0]
+        self.outcomes = [hand_outcome(hand, dealer_hand) for hand in self.player.hands]
+        for hand, stake in zip(self.player.hands, self.bets):
+            multiplier = hand_payout(hand, dealer_hand)
+            if multiplier:
+                self._pay(multiplier, stake)
+        result = self.determine_winner()
+        self.message = result
+        if self.on_round_end is not None:
+            self.on_round_end(result)
+        self._settled()
+
+    def _pay(self, multiplier, stake):
+        self.wallet.payout(multiplier, stake)
+        self.returned += int(stake * multiplier)
+
+    def _settled(self):
+        if self.on_settled is not None:
+            self.on_settled(self)
+
+    def determine_winner(self):
+        results = []
+        dealer_bust = self.dealer.hands[0].is_bust()
+        for i, outcome in enumerate(self.outcomes):
+            label = f"Hand {i+1}"
+            if self.player.hands[i].is_bust():
+                results.append(f"{label}: Busted! Dealer wins.")
+            elif dealer_bust:
+                results.append(f"{label}: Dealer busted! Player wins!")
+            else:
+                results.append(f"{label}: {OUTCOME_TEXT[outcome]}")
+        # Junta mensagens em linhas
+        return " | ".join(results)
@@ -1,33 +1,41 @@
 import pygame, sys
 from Configs import *
-from cartas import Deck, Hand
-from player import Player, Dealer
+from cartas import Shoe, Hand
+from engine import RoundEngine
+from solver import best_action
+from strategy import basic_strategy
 from botao import Button
 from bank import Bank
-from cardSprite import CardSprite
-import os
+from cardSprite import CardSprite, SpriteGroup
+from textcache import render_text
+from viewport import Viewport, sys_font, outline
+from atlas import load_atlas, card_name
+from ledger import RoundLedger, LEDGER_FILE
+from audio import SoundManager
+from profiler import profiler
+from replay import SessionRecorder, REPLAY_DIR
+import random
 
 class Game:
-    def __init__(self, screen):
+    def __init__(self, screen, bank_file="bank.json", ledger_path=LEDGER_FILE, replay_dir=REPLAY_DIR):
         self.base_width = SCREEN_WIDTH
         self.base_height = SCREEN_HEIGHT
-        self.base_surface = pygame.Surface((self.base_width, self.base_height))
         self.deck_pos = (self.base_width // 2 - CARD_WIDTH // 2, 50)
-        self.card_images = self.load_card_images("png-cards")
+        self.images = load_atlas()  # todas as imagens já escaladas, de um só arquivo
+        self.card_images = self.load_card_images(self.images)
+        self.img_dinheiro = self.images['dinheiro']
         self.screen = screen
-        self.deck = Deck(num_decks=4)
-        self.player = Player()
-        self.dealer = Dealer()
-        self.font = pygame.font.SysFont("serif", 22, bold=True)
-        self.big_font = pygame.font.SysFont("serif", 36, bold=True)
-        self.state = 'idle'
-        self.message = 'Click DEAL to start'
-        self.animated_cards = []  # store CardSprite instances
-        self.dinheiro_sprite = None
+        self.view = Viewport((self.base_width, self.base_height), screen.get_size())
+        self.font = sys_font("serif", 22, bold=True)
+        self.big_font = sys_font("serif", 36, bold=True)
+        self.small_font = sys_font("serif", 16, bold=True)
+        self.sprites = SpriteGroup()  # cartas (e dinheiro) em movimento
+        self.last_tick = pygame.time.get_ticks()
         self.deck_pos = (self.base_width // 2 - CARD_WIDTH // 2, 50)  # center deck position
 
         self.fullscreen = False
-        self.player_doubled = [False for _ in self.player.hands]
+        self.hint = None  # (ação, EV) sugerida para a mão atual
+        self.bot = None  # Strategy jogando sozinha as mãos (tecla B)
 
         # UI Buttons
         self.btn_deal = Button((20, self.base_height - 60, 100, 40), 'DEAL', self.font)
@@ -36,353 +44,202 @@ class Game:
         self.btn_split = Button((380, self.base_height - 60, 100, 40), 'SPLIT', self.font)
         self.btn_double = Button((500, self.base_height - 60, 120, 40), 'DOUBLE', self.font)
         self.btn_quit = Button((self.base_width - 120, self.base_height - 60, 100, 40), 'QUIT', self.font)
+        self.buttons = [self.btn_deal, self.btn_hit, self.btn_stand, self.btn_split, self.btn_double, self.btn_quit]
+
+        # Static table and the regions render() redraws when they change
+        self.background = None
+        self.dealer_rect = pygame.Rect(0, 0, self.base_width, 240)
+        self.player_rect = pygame.Rect(0, 205, self.base_width, 315)
+        self.message_rect = pygame.Rect(0, 225, self.base_width, 35)
+        self.bank_rect = pygame.Rect(self.base_width - 400, 60, 400, 170)
+        self.hint_rect = pygame.Rect(self.btn_double.rect.right + 10, self.base_height - 65, 280, 50)
+        self.history_rect = pygame.Rect(100, 110, self.base_width - 200, 360)
+        self.perf_rect = pygame.Rect(5, 5, 420, 64)
+        self.last_regions = []
+        self.full_redraw = True
 
         # Bank
-        self.bank = Bank(initial_amount=1000, font=self.font)
-        self.dealer_img = pygame.image.load(os.path.join(os.path.dirname(__file__), "persona", "alex.png")).convert_alpha()
-        self.dealer_img = pygame.transform.scale(self.dealer_img, (100, 100))
-        self.player_img = pygame.image.load(os.path.join(os.path.dirname(__file__), "persona", "marim.png")).convert_alpha()
-        self.player_img = pygame.transform.scale(self.player_img, (100, 150))
-         # Initialize sound mixer
-        pygame.mixer.init()
-
-        # Set volume levels (adjust these values between 0.0 and 1.0)
-        self.music_volume = 0.1  # Background music volume
-        self.sfx_volume = 0.5    # Sound effects volume
-
-        # Load background music (you can add the file later)
-        try:
-            pygame.mixer.music.load(os.path.join(os.path.dirname(__file__), "sounds", "background.mp3"))
-            pygame.mixer.music.set_volume(self.music_volume)
-            pygame.mixer.music.play(-1)  # Loop indefinitely
-        except pygame.error:
-            print("Background music file not found. Add 'sounds/background.mp3' to enable music.")
-
-        # Sound effect paths (add files later)
-        self.sound_win = os.path.join(os.path.dirname(__file__), "sounds", "win.mp3")
-        self.sound_lose = os.path.join(os.path.dirname(__file__), "sounds", "lose.mp3")
-
-    def animate_card_to_player(self, card, hand_index, card_index):
+        self.bank = Bank(initial_amount=1000, font=self.font, save_file=bank_file)
+
+        # Regras da rodada; o shoe tem RNG próprio para a sessão poder ser reproduzida
+        self.seed = random.randrange(1 << 63)
+        self.engine = RoundEngine(Shoe(num_decks=4, penetration=0.75, rng=random.Random(self.seed)), self.bank)
+        self.engine.on_card = self.on_card_dealt
+        self.engine.on_round_end = self.end_round
+        self.engine.on_settled = self.round_settled
+
+        # Gravação da sessão (seed + ações), reexecutável com replay.py
+        self.recorder = SessionRecorder.for_engine(self.engine, self.seed, replay_dir) if replay_dir else None
+        if self.recorder:
+            self.engine.on_action = self.recorder.action
+
+        # Histórico de rodadas (tecla H abre, PageUp/PageDown paginam)
+        self.ledger = RoundLedger(ledger_path)
+        self.show_history = False
+        self.history_page = 0
+        # Overlay de desempenho (F3); texto recalculado a cada PERF_REFRESH_MS
+        self.show_perf = False
+        self.perf_lines = ()
+        self.perf_updated = 0
+        self.update_buttons()
+
+        self.dealer_img = self.images['dealer']
+        self.player_img = self.images['player']
+        self.prepare_view()
+
+        # Sons decodificados uma vez; tocam por canais reservados
+        self.sounds = SoundManager(music_volume=0.1, sfx_volume=0.5)
+        self.sounds.play_music()
+
+    CARD_FLIGHT = 0.3   # segundos do baralho até a mão
+    CARD_STAGGER = 0.12  # intervalo entre cartas seguidas
+
+    def player_card_pos(self, hand_index, card_index):
         hand_x = 50 + hand_index * (CARD_WIDTH + CARD_GAP) * 5
         base_y = self.base_height - CARD_HEIGHT - 120
-        target_pos = (hand_x + card_index * (CARD_WIDTH + CARD_GAP), base_y)
+        return (hand_x + card_index * (CARD_WIDTH + CARD_GAP), base_y)
+
+    def dealer_card_pos(self, card_index):
+        return (50 + card_index * (CARD_WIDTH + CARD_GAP), 80)
+
+    def add_sprite(self, sprite, stagger=0.0):
+        # Depois de um tempo ocioso, a animação conta a partir de agora
+        if not self.sprites:
+            self.last_tick = pygame.time.get_ticks()
+        self.sprites.add(sprite, stagger)
+
+    def is_busy(self):
+        """True while something on the table still moves (the loop keeps full frame rate)."""
+        return bool(self.sprites) or self.full_redraw or (self.bot is not None and self.state == 'playing')
+
+    def animate_card(self, img, target_pos, key):
+        sprite = CardSprite(img, self.deck_pos, target_pos, duration=self.CARD_FLIGHT, layer=1, key=key)
+        self.add_sprite(sprite, stagger=self.CARD_STAGGER)
+
+    def animate_card_to_player(self, card, hand_index, card_index):
         img = self.card_images.get((card.rank, card.suit), None)
         if img:
-            sprite = CardSprite(img, self.deck_pos, target_pos, speed=15)
-            self.animated_cards.append(sprite)
+            self.animate_card(img, self.player_card_pos(hand_index, card_index), ('player', hand_index, card_index))
 
-    def animate_card_to_dealer(self, card, card_index):
-        dealer_x = 50
-        dealer_y = 80
-        target_pos = (dealer_x + card_index * (CARD_WIDTH + CARD_GAP), dealer_y)
-        img = self.card_images.get((card.rank, card.suit), None)
+    def animate_card_to_dealer(self, card, card_index, face_down=False):
+        img = self.card_images['back'] if face_down else self.card_images.get((card.rank, card.suit), None)
         if img:
-            sprite = CardSprite(img, self.deck_pos, target_pos, speed=15)
-            self.animated_cards.append(sprite)
+            self.animate_card(img, self.dealer_card_pos(card_index), ('dealer', 0, card_index))
 
-    def start_round(self):
-        # Deduct bet first
-        if not self.bank.place_bet():
-            self.message = "Not enough money to bet!"
-            return
+    # --------- Estado da rodada (delegado ao RoundEngine) ---------
+    @property
+    def deck(self):
+        return self.engine.deck
 
-        self.player.reset()
-        self.dealer.reset()
-        self.player.current_hand = 0
-
-        # UI button state
-        self.state = 'playing'
-        self.message = ''
-        self.btn_deal.enabled = False
-        self.btn_hit.enabled = True
-        self.btn_stand.enabled = True
-        self.btn_split.enabled = False   # disabled until cards are dealt
-        self.btn_double.enabled = True
-
-        self.player_doubled = [False for _ in self.player.hands]
-
-        # Deal cards in order: player, dealer, player, dealer
-        deal_order = [
-            ('player', 0),
-            ('dealer', 0),
-            ('player', 0),
-            ('dealer', 0)
-        ]
+    @property
+    def player(self):
+        return self.engine.player
 
-        for target, hand_index in deal_order:
-            card = self.deck.draw()
-            if target == 'player':
-                self.player.hands[hand_index].add(card)
-                self.animate_card_to_player(card, hand_index, len(self.player.hands[hand_index].cards)-1)
-            else:
-                self.dealer.hands[hand_index].add(card)
-                self.animate_card_to_dealer(card, len(self.dealer.hands[hand_index].cards)-1)
-
-        # Check for Blackjack immediately
-        player_blackjack = self.player.hands[0].is_blackjack()
-        dealer_blackjack = self.dealer.hands[0].is_blackjack()
-
-        if player_blackjack or dealer_blackjack:
-            if player_blackjack and dealer_blackjack:
-                self.message = 'Push: both have Blackjack'
-            elif player_blackjack:
-                self.message = 'Blackjack! You win!'
-                self.bank.payout(2.5)
-            else:
-                self.message = 'Dealer has Blackjack! You lose.'
+    @property
+    def dealer(self):
+        return self.engine.dealer
 
-            # End round immediately if Blackjack occurs
-            self.state = 'round_over'
-            self.btn_deal.enabled = True
-            self.btn_hit.enabled = False
-            self.btn_stand.enabled = False
-            self.btn_split.enabled = False
-            self.btn_double.enabled = False
-            return   # ⬅ IMPORTANT: stops execution so split doesn't get enabled later
+    @property
+    def state(self):
+        return self.engine.state
 
-        # Enable SPLIT only if the hand can be split and player has money for second bet
-        can_split = self.player.can_split() and self.bank.amount >= self.bank.bet
-        self.btn_split.enabled = can_split
+    @property
+    def message(self):
+        return self.engine.message
 
-        # Double is only allowed if two cards
-        self.btn_double.enabled = len(self.player.hands[self.player.current_hand].cards) == 2
+    @message.setter
+    def message(self, text):
+        self.engine.message = text
 
-    def player_hit(self):
+    def on_card_dealt(self, target, hand_index, card_index, card, phase):
+        # Toda carta sai do baralho; a hole card do dealer voa virada
+        if target == 'player':
+            self.animate_card_to_player(card, hand_index, card_index)
+        else:
+            self.animate_card_to_dealer(card, card_index, face_down=(phase == 'deal' and card_index == 0))
+
+    def update_buttons(self):
+        self.btn_deal.enabled = self.engine.can_deal()
+        self.btn_hit.enabled = self.engine.can_hit()
+        self.btn_stand.enabled = self.engine.can_stand()
+        self.btn_split.enabled = self.engine.can_split()
+        self.btn_double.enabled = self.engine.can_double()
+        self.update_hint()
+
+    def update_hint(self):
+        # Calculado após cada ação, nunca dentro do render
         if self.state != 'playing':
+            self.hint = None
             return
         hand = self.player.hands[self.player.current_hand]
-        hand.add(self.deck.draw())
-        self.btn_split.enabled = False  # após hit, split desabilita
-
-        if hand.is_bust():
-            self.message = f'Hand {self.player.current_hand + 1} busted!'
+        comp = self.dealer.unseen_composition(self.deck)
+        self.hint = best_action(hand, self.dealer.upcard(), comp,
+                                can_double=self.btn_double.enabled,
+                                can_split=self.btn_split.enabled)
 
-            # Avança para próxima mão, se houver
-            if self.player.current_hand + 1 < len(self.player.hands):
-                self.player.current_hand += 1
-                self.message += f' Playing hand {self.player.current_hand + 1}.'
-            else:
-                self.message += ' All hands played.'
-                self.state = 'player_stand'
-                self.btn_hit.enabled = False
-                self.btn_stand.enabled = False
-                self.btn_split.enabled = False
-                self.dealer_play()
+    def start_round(self):
+        self.engine.deal()
+        self.update_buttons()
 
-        elif 21 in hand.values():
-            self.player_stand()
+    def player_hit(self):
+        self.engine.hit()
+        self.update_buttons()
 
     def player_stand(self):
-        if self.state != 'playing':
-            return
-        # Avança para próxima mão, se houver
-        if self.player.current_hand + 1 < len(self.player.hands):
-            self.player.current_hand += 1
-            self.message = f'Playing hand {self.player.current_hand + 1} of {len(self.player.hands)}'
-            self.btn_split.enabled = False  # split só na primeira mão
-        else:
-            self.state = 'player_stand'
-            self.btn_hit.enabled = False
-            self.btn_stand.enabled = False
-            self.btn_split.enabled = False
-            self.dealer_play()
-
+        self.engine.stand()
+        self.update_buttons()
 
     def player_split(self):
-        # check money before doing split
-        if not self.player.can_split():
-            self.message = 'Cannot split these cards.'
-            return
-
-        # require enough money for another bet
-        if self.bank.amount < self.bank.bet:
-            self.message = 'Not enough money to split!'
-            return
-
-        # Deduct the second-hand bet
-        self.bank.place_bet()
-
-        if self.player.split():
-            # draw one card for each split hand
-            self.player.hands[0].add(self.deck.draw())
-            self.player.hands[1].add(self.deck.draw())
-
-            self.player_doubled = [False] * len(self.player.hands)
-
-            self.message = 'Split done: playing first hand'
-
-            # allow/disable split/double buttons as needed
-            self.btn_split.enabled = self.player.can_split()
-            self.btn_double.enabled = True
-        else:
-            self.message = 'Cannot split these cards.'
+        self.engine.split()
+        self.update_buttons()
 
     def player_double(self):
-        if self.state != 'playing':
-            return
-
-        hand_index = self.player.current_hand
-        hand = self.player.hands[hand_index]
+        self.engine.double()
+        self.update_buttons()
 
-        # Only allow double once per hand
-        if self.player_doubled[hand_index]:
-            self.message = "You already doubled this hand!"
+    def bot_step(self):
+        # Uma ação por frame, só depois que as cartas da anterior pousaram
+        if self.bot is None or self.state != 'playing' or self.sprites:
             return
+        self.engine.play(self.bot(self.engine))
+        self.update_buttons()
 
-        # Only allowed with exactly two cards
-        if len(hand.cards) != 2:
-            self.message = "You can only double on your first two cards!"
-            return
-
-        # Check for enough money
-        if self.bank.bet > self.bank.amount:
-            self.message = "Not enough money to double!"
-            return
-
-        # Deduct additional bet
-        self.bank.place_bet()
-        self.bank.bet *= 2
-        self.player_doubled[hand_index] = True
-
-        # Add one card
-        hand.add(self.deck.draw())
-
-        # Move to next hand or dealer
-        if hand.is_bust():
-            self.message = f"Hand {hand_index + 1} busted after double!"
-        else:
-            self.message = f"Hand {hand_index + 1} doubled down."
-
-        # If more hands remain, move to the next one
-        if hand_index + 1 < len(self.player.hands):
-            self.player.current_hand += 1
-            self.message += f" Playing hand {self.player.current_hand + 1}."
-            self.btn_split.enabled = False
-            self.btn_double.enabled = True
-            self.btn_hit.enabled = True
-            self.btn_stand.enabled = True
-        else:
-            # All hands done, dealer plays
-            self.btn_hit.enabled = False
-            self.btn_stand.enabled = False
-            self.btn_split.enabled = False
-            self.btn_double.enabled = False
-            self.state = 'player_stand'
-            self.dealer_play()
-
-    def dealer_play(self):
-        while not self.dealer.hands[0].is_bust() and self.dealer.should_hit():
-            self.dealer.hands[0].add(self.deck.draw())
-        self.end_round()
-
-    def end_round(self):
-        self.state = 'round_over'
-        self.btn_deal.enabled = True
-        self.btn_hit.enabled = False
-        self.btn_stand.enabled = False
-        self.btn_split.enabled = False
-        result = self.determine_winner()
+    def end_round(self, result):
         # Play win/lose sound based on result
         if "Player wins" in result or "Dealer busted" in result:
-            try:
-                sound = pygame.mixer.Sound(self.sound_win)
-                sound.set_volume(self.sfx_volume)
-                sound.play()
-            except pygame.error:
-                pass  # Sound file not found, skip
+            self.sounds.play('win')
         elif "Dealer wins" in result or "Busted" in result:
-            try:
-                sound = pygame.mixer.Sound(self.sound_lose)
-                sound.set_volume(self.sfx_volume)
-                sound.play()
-            except pygame.error:
-                pass  # Sound file not found, skip
-
-        # Handle payouts
-        for i, hand in enumerate(self.player.hands):
-            p_best = hand.best_value()
-            d_best = self.dealer.hands[0].best_value()
-            if hand.is_bust():
-                continue
-            elif self.dealer.hands[0].is_bust() or p_best > d_best:
-                self.bank.payout(2)
-            elif hand.is_blackjack() and not self.dealer.hands[0].is_blackjack():
-                self.bank.payout(2.5)
-            elif p_best == d_best:  # Push (tie)
-                self.bank.payout(1)  # Return bet
+            self.sounds.play('lose')
 
-        self.message = result
+    def round_settled(self, engine):
+        self.ledger.append_round(engine)
+        if self.recorder:
+            self.recorder.settled(engine)
 
     def determine_winner(self):
-        results = []
-        dealer_hand = self.dealer.hands[0]
-        d_best = dealer_hand.best_value()
-        dealer_bust = dealer_hand.is_bust()
-
-        # avalia cada mão do jogador
-        for i, hand in enumerate(self.player.hands):
-            p_best = hand.best_value()
-            label = f"Hand {i+1}"
-
-            if hand.is_bust():
-                results.append(f"{label}: Busted! Dealer wins.")
-            elif dealer_bust:
-                results.append(f"{label}: Dealer busted! Player wins!")
-            elif hand.is_blackjack() and not dealer_hand.is_blackjack():
-                results.append(f"{label}: Blackjack! Player wins!")
-            elif dealer_hand.is_blackjack() and not hand.is_blackjack():
-                results.append(f"{label}: Dealer has Blackjack! You lose.")
-            elif p_best > d_best:
-                results.append(f"{label}: Player wins!")
-            elif p_best < d_best:
-                results.append(f"{label}: Dealer wins.")
-            else:
-                results.append(f"{label}: Push (tie).")
-
-        # Junta mensagens em linhas
-        return " | ".join(results)
-
-    def animate_dinheiro(self, start_pos, target_pos, speed=8):
-        self.dinheiro_sprite = CardSprite(self.img_dinheiro, start_pos, target_pos, speed)
-
-
-    def load_card_images(self, folder):
-        images = {}
-        # Supondo que a pasta tem arquivos no formato "ace_of_spades.png", etc
-        for rank in RANKS:
-            for suit in SUITS:
-                filename = f"{rank}_of_{SUITS[suit].lower()}.png"
-                path = os.path.join(folder, filename)
-                if os.path.isfile(path):
-                    img = pygame.image.load(path).convert_alpha()
-                    img = pygame.transform.smoothscale(img, (CARD_WIDTH, CARD_HEIGHT))
-                    images[(rank, suit)] = img
-                else:
-                    # placeholder se arquivo não existir (retângulo)
-                    img = pygame.Surface((CARD_WIDTH, CARD_HEIGHT))
-                    img.fill(CARD_COLOR)
-                    pygame.draw.rect(img, CARD_BORDER, img.get_rect(), 2)
-                    # Desenha rank e suit texto
-                    font = pygame.font.SysFont("serif", 20, bold=True)
-                    text1 = font.render(rank[0].upper(), True, TEXT_COLOR)
-                    text2 = font.render(suit, True, TEXT_COLOR)
-                    img.blit(text1, (5, 5))
-                    img.blit(text2, (5, 25))
-                    images[(rank, suit)] = img
-        # Card back
-        back = pygame.Surface((CARD_WIDTH, CARD_HEIGHT))
-        back.fill((100, 20, 20))
-        pygame.draw.rect(back, (0,0,0), back.get_rect(), 2)
-        images['back'] = back
+        return self.engine.determine_winner()
+
+    def animate_dinheiro(self, start_pos, target_pos, duration=0.5):
+        self.add_sprite(CardSprite(self.img_dinheiro, start_pos, target_pos, duration=duration, layer=2))
+
+
+    def load_card_images(self, atlas):
+        # Subsurfaces do atlas (ver atlas.py), indexadas por (rank, suit)
+        images = {(rank, suit): atlas[card_name(rank, suit)] for rank in RANKS for suit in SUITS}
+        images['back'] = atlas['back']
         return images
 
     def draw_card(self, surf, card, pos):
         img = self.card_images.get((card.rank, card.suit), None)
         if img:
-            surf.blit(img, pos)
+            self.view.blit(surf, img, pos)
 
     def draw_back_card(self, surf, pos):
-        surf.blit(self.card_images['back'], pos)
+        self.view.blit(surf, self.card_images['back'], pos)
+
+    def draw_text(self, surf, font, text, color, pos):
+        txt = render_text(self.view.font(font), text, True, color)
+        surf.blit(txt, self.view.point(pos))
 
     def toggle_fullscreen(self):
         self.fullscreen = not self.fullscreen
@@ -391,40 +248,155 @@ class Game:
             self.screen = pygame.display.set_mode((info.current_w, info.current_h), pygame.FULLSCREEN)
         else:
             self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-
-    def render(self):
-        surf = self.base_surface
-        surf.fill(TABLE_COLOR)
-
-        # Draw table pattern
+        profiler.lap('events')
+        self.view = Viewport((self.base_width, self.base_height), self.screen.get_size())
+        self.prepare_view()
+        profiler.lap('scaling')
+
+    def prepare_view(self):
+        # Pré-escala tudo uma vez por resolução; os quadros só fazem blit
+        for img in list(self.card_images.values()) + [self.dealer_img, self.player_img]:
+            self.view.image(img)
+        self.background = self.build_background()
+        self.full_redraw = True
+
+    def build_background(self):
+        # Feltro, padrão de pontos e título não mudam: desenhados uma vez por resolução
+        view = self.view
+        bg = pygame.Surface(self.screen.get_size()).convert()
+        bg.fill((0, 0, 0))  # black bars
+        bg.fill(TABLE_COLOR, view.rect((0, 0, self.base_width, self.base_height)))
         for y in range(0, self.base_height, 20):
             for x in range(0, self.base_width, 20):
-                pygame.draw.circle(surf, (20, 120, 50), (x+10, y+10), 2)
+                pygame.draw.circle(bg, (20, 120, 50), view.point((x+10, y+10)), view.length(2))
+        title = render_text(view.font(self.big_font), "Casino Clássico - Blackjack", True, (255, 255, 255))
+        title_x, title_y = view.point((self.base_width // 2, 10))
+        bg.blit(title, (title_x - title.get_width() // 3, title_y))
+        return bg
+
+    def scene_regions(self, mouse_pos):
+        """(rect, key) for each part of the table; the rect is redrawn when its key changes."""
+        regions = [
+            (self.dealer_rect, (self.state == 'playing', tuple(self.dealer.hands[0].cards))),
+            (self.player_rect, (tuple(tuple(h.cards) for h in self.player.hands), self.player.current_hand)),
+            (self.message_rect, self.message),
+            (self.bank_rect, (self.bank.amount, self.bank.bet, self.bank.input_text, self.bank.input_color)),
+            (self.hint_rect, self.hint),
+            (self.history_rect, (self.show_history, self.history_page, len(self.ledger) if self.show_history else 0)),
+            (self.perf_rect, self.perf_lines if self.show_perf else None),
+        ]
+        for btn in self.buttons:
+            regions.append((btn.rect.inflate(4, 4), (btn.text, btn.enabled, btn.rect.collidepoint(mouse_pos))))
+        return regions
 
-        # Title
-        title = self.big_font.render("Casino Clássico - Blackjack", True, (255, 255, 255))
-        surf.blit(title, (self.base_width // 2 - title.get_width() // 3, 10))
+    def mouse_position(self):
+        """Mouse position in base-layout coordinates."""
+        return self.view.to_base(pygame.mouse.get_pos())
 
-        if self.dinheiro_sprite:
-            self.dinheiro_sprite.update()
-            self.dinheiro_sprite.draw(surf)
-            if self.dinheiro_sprite.done:
-                self.dinheiro_sprite = None
+    def render(self):
+        mouse_pos = self.mouse_position()
+        self.update_perf()
 
-        for sprite in self.animated_cards[:]:
-            sprite.update()
-            sprite.draw(surf)
-            if sprite.done:
-                self.animated_cards.remove(sprite)
+        # Dirty regions: changed scene parts plus old/new rect of every moving sprite
+        regions = self.scene_regions(mouse_pos)
+        if self.full_redraw or len(regions) != len(self.last_regions):
+            dirty = [pygame.Rect(0, 0, self.base_width, self.base_height)]
+        else:
+            dirty = [rect for (rect, key), (_, old_key) in zip(regions, self.last_regions) if key != old_key]
+        self.last_regions = regions
+        full = self.full_redraw
+        self.full_redraw = False
+        profiler.lap('regions')
+
+        # Animação por tempo real, não por quadro
+        now = pygame.time.get_ticks()
+        dt = (now - self.last_tick) / 1000
+        self.last_tick = now
+        moved = self.sprites.update(dt)
+        profiler.lap('sprites')
+
+        if not dirty and not moved:
+            return
+
+        # Desenha direto na tela, na resolução nativa, só dentro das áreas sujas
+        if full:
+            screen_dirty = [self.screen.get_rect()]
+        else:
+            screen_dirty = [self.view.rect(rect) for rect in dirty]
+            # Folga já na tela: Rect trunca a posição float do sprite e a imagem
+            # escalada arredonda o tamanho, até um pixel base escalado e mais um
+            pad = 2 * (self.view.length(1) + 1)
+            screen_dirty += [self.view.rect(rect).inflate(pad, pad) for rect in moved]
+        self.screen.set_clip(screen_dirty[0].unionall(screen_dirty[1:]))
+        self.draw_table(self.screen, mouse_pos)
+        self.screen.set_clip(None)
+        pygame.display.update(screen_dirty)
+        profiler.lap('flip')
+
+    PERF_REFRESH_MS = 500
+
+    def update_perf(self):
+        if not self.show_perf or pygame.time.get_ticks() - self.perf_updated < self.PERF_REFRESH_MS:
+            return
+        self.perf_updated = pygame.time.get_ticks()
+        stats = profiler.stats()
+        top = "  ".join(f"{name} {ms:.2f}" for name, ms in stats["phases"][:3])
+        self.perf_lines = (
+            f"FPS {stats['fps']:.1f}   frame p50 {stats['p50_ms']:.2f} ms   p99 {stats['p99_ms']:.2f} ms",
+            f"top (ms): {top}",
+        )
+
+    def draw_perf(self, surf):
+        rect = self.view.rect(self.perf_rect)
+        panel = pygame.Surface(rect.size, pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        surf.blit(panel, rect)
+        # Texto não vaza do painel: só essa região é redesenhada quando ele muda
+        clip = surf.get_clip()
+        surf.set_clip(clip.clip(rect))
+        for i, line in enumerate(self.perf_lines):
+            self.draw_text(surf, self.small_font, line, (0, 255, 255), (self.perf_rect.x + 8, self.perf_rect.y + 8 + i * 26))
+        surf.set_clip(clip)
+
+    HISTORY_LINES = 12
+
+    def draw_history(self, surf):
+        # Página 0 = rodadas mais recentes; só lê do ledger as linhas visíveis
+        view = self.view
+        panel = pygame.Surface(view.rect(self.history_rect).size, pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 200))
+        surf.blit(panel, view.rect(self.history_rect))
+        total = len(self.ledger)
+        stop = max(0, total - self.history_page * self.HISTORY_LINES)
+        records = self.ledger.page(stop - self.HISTORY_LINES, self.HISTORY_LINES)
+        x, y = self.history_rect.x + 15, self.history_rect.y + 10
+        header = f"History: rounds {stop - len(records) + 1}-{stop} of {total}  (PgUp/PgDn, H to close)"
+        self.draw_text(surf, self.font, header, (255, 255, 0), (x, y))
+        for i, rec in enumerate(reversed(records)):
+            hands = " / ".join(" ".join(card.label() for card in hand) for hand in rec["hands"])
+            dealer = " ".join(card.label() for card in rec["dealer"])
+            line = f"#{rec['round'] + 1} {rec['hand_type']:<9} {rec['net']:+5d}  {rec['actions'] or '-'}  {hands}  vs {dealer}"
+            color = (120, 255, 120) if rec["net"] > 0 else (255, 120, 120) if rec["net"] < 0 else (255, 255, 255)
+            self.draw_text(surf, self.small_font, line, color, (x, y + 35 + i * 25))
+
+    def draw_table(self, surf, mouse_pos):
+        view = self.view
+        surf.blit(self.background, (0, 0))
+        profiler.lap('background')
+
+        # Cartas ainda voando não aparecem na mão até chegarem
+        flying = self.sprites.keys()
 
         # Draw dealer
         dealer_x = 50
         dealer_y = 80
-        surf.blit(self.dealer_img, (dealer_x + 130, dealer_y - 100))
-        surf.blit(self.font.render("Dealer", True, (255, 255, 255)), (dealer_x, dealer_y - 30))
+        view.blit(surf, self.dealer_img, (dealer_x + 130, dealer_y - 100))
+        self.draw_text(surf, self.font, "Dealer", (255, 255, 255), (dealer_x, dealer_y - 30))
         dealer_hand = self.dealer.hands[0]
         for i, card in enumerate(dealer_hand.cards):
             pos = (dealer_x + i*(CARD_WIDTH+CARD_GAP), dealer_y)
+            if ('dealer', 0, i) in flying:
+                continue
             if self.state == 'playing' and i == 0:
                 self.draw_back_card(surf, pos)
             else:
@@ -442,74 +414,65 @@ class Game:
             val = dealer_hand.best_value()
             val_text = f"Value: {val}" if not dealer_hand.is_bust() else "Bust!"
         color = (255, 0, 0) if dealer_hand.is_bust() else (255, 255, 255)
-        surf.blit(self.font.render(val_text, True, color), (dealer_x, dealer_y + CARD_HEIGHT + 5))
+        self.draw_text(surf, self.font, val_text, color, (dealer_x, dealer_y + CARD_HEIGHT + 5))
+        profiler.lap('dealer')
 
         # Draw player hands
         base_y = self.base_height - CARD_HEIGHT - 120
         for idx, hand in enumerate(self.player.hands):
             hand_x = 50 + idx * (CARD_WIDTH + CARD_GAP) * 5
-            surf.blit(self.player_img, (hand_x + 130, base_y - 150))
+            view.blit(surf, self.player_img, (hand_x + 130, base_y - 150))
             label = "Player" + (f" (Hand {idx+1})" if len(self.player.hands) > 1 else "")
-            surf.blit(self.font.render(label, True, (255, 255, 255)), (hand_x, base_y - 30))
+            self.draw_text(surf, self.font, label, (255, 255, 255), (hand_x, base_y - 30))
 
             for i, card in enumerate(hand.cards):
                 pos = (hand_x + i*(CARD_WIDTH + CARD_GAP), base_y)
+                if ('player', idx, i) in flying:
+                    continue
                 self.draw_card(surf, card, pos)
 
             val = hand.best_value()
             val_text = f"Value: {val}" if not hand.is_bust() else "Bust!"
             color = (255, 0, 0) if hand.is_bust() else (255, 255, 255)
-            surf.blit(self.font.render(val_text, True, color), (hand_x, base_y + CARD_HEIGHT + 5))
+            self.draw_text(surf, self.font, val_text, color, (hand_x, base_y + CARD_HEIGHT + 5))
 
             # Highlight current hand
             if len(self.player.hands) > 1 and idx == self.player.current_hand:
-                pygame.draw.rect(surf, (255, 255, 255),
-                                (hand_x - 5, base_y - 5, (CARD_WIDTH + CARD_GAP) * len(hand.cards), CARD_HEIGHT + 10), 3)
+                outline(surf, (255, 255, 255),
+                        view.rect((hand_x - 5, base_y - 5, (CARD_WIDTH + CARD_GAP) * len(hand.cards), CARD_HEIGHT + 10)), view.length(3))
 
-        # Message
-        msg_surf = self.font.render(self.message, True, (255, 255, 0))
-        surf.blit(msg_surf, (self.base_width // 2 - msg_surf.get_width() // 2, self.base_height - 370 ))
+        profiler.lap('player')
 
-        # Draw Bank
-        self.bank.draw(surf, (self.base_width - 220, 70))
+        self.sprites.draw(surf, view)
+        profiler.lap('sprites')
 
-        # Determine scaled mouse position
-        mx, my = pygame.mouse.get_pos()
-        if self.fullscreen:
-            screen_w, screen_h = self.screen.get_size()
-            scale_w = screen_w / self.base_width
-            scale_h = screen_h / self.base_height
-            scale = min(scale_w, scale_h)
-
-            new_w = int(self.base_width * scale)
-            new_h = int(self.base_height * scale)
-            pos_x = (screen_w - new_w) // 2
-            pos_y = (screen_h - new_h) // 2
-
-            mouse_pos = ((mx - pos_x) / scale, (my - pos_y) / scale)
-        else:
-            scale = 1
-            pos_x = pos_y = 0
-            mouse_pos = (mx, my)
-
-        # Draw buttons on base surface
-        self.btn_deal.draw(surf, mouse_pos)
-        self.btn_hit.draw(surf, mouse_pos)
-        self.btn_stand.draw(surf, mouse_pos)
-        self.btn_split.draw(surf, mouse_pos)
-        self.btn_double.draw(surf, mouse_pos)
-        self.btn_quit.draw(surf, mouse_pos)
-
-        # Blit scaled surface to screen
-        if self.fullscreen:
-            scaled_surface = pygame.transform.smoothscale(self.base_surface, (new_w, new_h))
-            self.screen.fill((0, 0, 0))  # black bars
-            self.screen.blit(scaled_surface, (pos_x, pos_y))
-        else:
-            self.screen.blit(self.base_surface, (0, 0))
-
-        pygame.display.flip()
+        # Message
+        msg_surf = render_text(view.font(self.font), self.message, True, (255, 255, 0))
+        msg_x, msg_y = view.point((self.base_width // 2, self.base_height - 370))
+        surf.blit(msg_surf, (msg_x - msg_surf.get_width() // 2, msg_y))
+        profiler.lap('message')
 
+        # Draw Bank
+        self.bank.draw(surf, (self.base_width - 220, 70), view)
+        profiler.lap('bank')
+
+        # Draw buttons
+        for btn in self.buttons:
+            btn.draw(surf, mouse_pos, view)
+
+        # Strategy hint next to the action buttons
+        if self.hint:
+            action, ev = self.hint
+            hint_surf = render_text(view.font(self.font), f"Best: {action.upper()} ({ev:+.2f})", True, (255, 255, 0))
+            hint_x, hint_y = view.point((self.btn_double.rect.right + 15, self.btn_double.rect.centery))
+            surf.blit(hint_surf, (hint_x, hint_y - hint_surf.get_height() // 2))
+        profiler.lap('buttons')
+
+        if self.show_history:
+            self.draw_history(surf)
+        if self.show_perf:
+            self.draw_perf(surf)
+        profiler.lap('overlay')
 
     def handle_events(self, events):
         for event in events:
@@ -521,25 +484,25 @@ class Game:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_F11:
                     self.toggle_fullscreen()
+                elif event.key == pygame.K_F3:
+                    self.show_perf = not self.show_perf
+                    self.perf_updated = 0
+                elif event.key == pygame.K_h and not self.bank.input_active:
+                    self.show_history = not self.show_history
+                    self.history_page = 0
+                elif event.key == pygame.K_b and not self.bank.input_active:
+                    self.bot = None if self.bot else basic_strategy()
+                elif self.show_history and event.key == pygame.K_PAGEUP:
+                    self.history_page += 1
+                elif self.show_history and event.key == pygame.K_PAGEDOWN:
+                    self.history_page = max(0, self.history_page - 1)
 
                 # Pass keyboard events to bank for typing
                 self.bank.handle_event(event)
 
             elif event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION):
-                # Scale mouse coordinates for fullscreen
-                mx, my = event.pos
-                if self.fullscreen:
-                    screen_w, screen_h = self.screen.get_size()
-                    scale_w = screen_w / self.base_width
-                    scale_h = screen_h / self.base_height
-                    scale = min(scale_w, scale_h)
-                    new_w = int(self.base_width * scale)
-                    new_h = int(self.base_height * scale)
-                    pos_x = (screen_w - new_w) // 2
-                    pos_y = (screen_h - new_h) // 2
-                    scaled_mouse = ((mx - pos_x) / scale, (my - pos_y) / scale)
-                else:
-                    scaled_mouse = (mx, my)
+                # Screen -> base-layout coordinates
+                scaled_mouse = self.view.to_base(event.pos)
 
                 # Pass mouse events to bank
                 temp_event = pygame.event.Event(event.type, {**event.dict, "pos": scaled_mouse})
@@ -559,4 +522,7 @@ class Game:
                         self.player_double()
                     elif self.btn_quit.clicked(temp_event):
                         pygame.quit()
-                        sys.exit()
\ No newline at end of file
+                        sys.exit()
+
+        self.bot_step()
+        profiler.lap('events')
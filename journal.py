@@ -0,0 +1,123 @@
+import atexit
+import json
+import os
+import threading
+
+
+class BankJournal:
+    """
+    Write-behind persistence for the bank state.
+
+    record() only stores the latest state and wakes a background writer, so
+    the render thread never touches the disk. The writer appends each state
+    (coalesced: only the newest one if several arrived meanwhile) as a JSON
+    line to `<snapshot>.journal` and fsyncs it. Every `compact_every` entries
+    (or on close) it writes the snapshot to a temp file and os.replace()s it
+    over the old one, then truncates the journal.
+
+    Every entry carries a sequence number that is also stored in the
+    snapshot, so recover() = snapshot + newer journal lines. A torn last
+    line from a crash mid-append is cut off the file by recover(), so the
+    next append starts on a line of its own.
+    """
+
+    def __init__(self, snapshot_path, compact_every=50):
+        self.snapshot_path = snapshot_path
+        self.journal_path = snapshot_path + ".journal"
+        self.compact_every = compact_every
+        self.seq = 0
+        self._pending = None
+        self._last = None
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = None
+
+    # --------- Leitura ---------
+    def recover(self):
+        """Latest durable state as a dict, or None if nothing was saved yet."""
+        state = None
+        if os.path.exists(self.snapshot_path):
+            try:
+                with open(self.snapshot_path, "r") as f:
+                    state = json.load(f)
+            except json.JSONDecodeError:
+                print(f"Warning: {os.path.basename(self.snapshot_path)} is corrupted. Using default values.")
+        snapshot_seq = state.get("seq", 0) if state else 0
+        self.seq = snapshot_seq
+
+        if os.path.exists(self.journal_path):
+            valid = 0  # fim da última linha inteira
+            with open(self.journal_path, "rb+") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # append cortado por um crash
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break  # linha corrompida: o resto não vale
+                    valid += len(line)
+                    if entry.get("seq", 0) > self.seq:
+                        state = entry
+                        self.seq = entry["seq"]
+                # Corta o lixo antes do próximo append, senão ele cola na linha cortada
+                if f.seek(0, os.SEEK_END) > valid:
+                    f.truncate(valid)
+                    f.flush()
+                    os.fsync(f.fileno())
+        return state
+
+    # --------- Escrita ---------
+    def record(self, state):
+        """Queue `state` for the writer thread; never blocks on I/O."""
+        with self._cond:
+            self.seq += 1
+            self._pending = dict(state, seq=self.seq)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="bank-journal", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+            self._cond.notify()
+
+    def _run(self):
+        appended = 0
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                entry, self._pending = self._pending, None
+                closed = self._closed
+            if entry is not None:
+                self._append(entry)
+                appended += 1
+                self._last = entry
+            if appended and (closed or appended >= self.compact_every):
+                self._compact(self._last)
+                appended = 0
+            if closed:
+                return
+
+    def _append(self, entry):
+        with open(self.journal_path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _compact(self, state):
+        tmp = self.snapshot_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.snapshot_path)
+        # O snapshot já cobre tudo que está no journal
+        with open(self.journal_path, "w"):
+            pass
+
+    def close(self):
+        """Flush pending state, compact and stop the writer (also run at exit)."""
+        with self._cond:
+            if self._thread is None or self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
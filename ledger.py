@@ -0,0 +1,227 @@
+import mmap
+import os
+import struct
+import time
+from Configs import BASE_DIR
+from cartas import CARDS
+
+LEDGER_FILE = os.path.join(BASE_DIR, "rounds.ledger")
+
+# Registro: cabeçalho fixo + cartas do dealer + (nº, cartas) por mão + ações
+#   round, time, session, bet, wagered, net, flags, hand_type, n_dealer, n_hands, n_actions
+RECORD = struct.Struct("<IdIiiiBBBBB")
+# Índice (arquivo .idx, mapeado em memória): offset, session, net, hand_type
+INDEX = struct.Struct("<QIiB3x")
+
+DOUBLED = 1
+SPLIT = 2
+PLAYER_BLACKJACK = 4
+DEALER_BLACKJACK = 8
+
+HAND_TYPES = ('hard', 'soft', 'pair', 'blackjack')
+
+
+def hand_type(cards):
+    """Category of the first two player cards: index into HAND_TYPES."""
+    c1, c2 = cards[0], cards[1]
+    if c1.points + c2.points == 11 and (c1.is_ace() or c2.is_ace()):
+        return HAND_TYPES.index('blackjack')
+    if c1.rank == c2.rank:
+        return HAND_TYPES.index('pair')
+    if c1.is_ace() or c2.is_ace():
+        return HAND_TYPES.index('soft')
+    return HAND_TYPES.index('hard')
+
+
+def _record_end(f, offset, size):
+    """Offset just past the record at `offset` in data file `f` (of `size` bytes), or None if it is cut."""
+    if offset + RECORD.size > size:
+        return None
+    f.seek(offset)
+    n_dealer, n_hands, n_actions = RECORD.unpack(f.read(RECORD.size))[-3:]
+    pos = offset + RECORD.size + n_dealer
+    for _ in range(n_hands):
+        if pos >= size:
+            return None
+        f.seek(pos)
+        pos += 1 + f.read(1)[0]
+    pos += n_actions
+    return pos if pos <= size else None
+
+
+class RoundLedger:
+    """
+    Append-only binary log of every round plus a fixed-width index.
+
+    The data file holds variable-length records (cards, actions, stakes,
+    payout); the index holds one INDEX entry per round and is read through
+    mmap, so queries (this session, net by hand type, last N, a page of
+    history) touch only the entries and records they need.
+    """
+
+    def __init__(self, path=LEDGER_FILE):
+        self.path = path
+        self.index_path = path + ".idx"
+        self._repair()
+        self._data = open(path, "ab")
+        self._index = open(self.index_path, "ab")
+        self._maps = {}
+        count = len(self)
+        self.next_round = count
+        self.session = self.entry(count - 1)[1] + 1 if count else 1
+        self.session_start = count
+
+    def _repair(self):
+        """
+        Cut what a crash mid-append left behind: a partial index entry, index
+        entries whose record is incomplete, and data after the last indexed
+        record. Later appends then stay aligned with the record boundaries.
+        Only the tail is read: the last index entries and their records.
+        """
+        with open(self.index_path, "ab"), open(self.path, "ab"):
+            pass  # cria os arquivos na primeira vez
+        size = os.path.getsize(self.path)
+        with open(self.index_path, "r+b") as index, open(self.path, "r+b") as data:
+            index_size = index.seek(0, os.SEEK_END)
+            count = index_size // INDEX.size
+            end = 0
+            while count:
+                index.seek((count - 1) * INDEX.size)
+                end = _record_end(data, INDEX.unpack(index.read(INDEX.size))[0], size)
+                if end is not None:
+                    break
+                count -= 1  # registro cortado: a entrada não vale
+                end = 0
+            if count * INDEX.size != index_size:
+                index.truncate(count * INDEX.size)
+            if end != size:
+                data.truncate(end)
+
+    # --------- Escrita ---------
+    def append_round(self, engine):
+        """Record a settled RoundEngine round (use as engine.on_settled)."""
+        player_hands = engine.player.hands
+        dealer_cards = engine.dealer.hands[0].cards
+        kind = hand_type(engine.initial_cards)
+        flags = 0
+        if any(engine.doubled):
+            flags |= DOUBLED
+        if len(player_hands) > 1:
+            flags |= SPLIT
+        if HAND_TYPES[kind] == 'blackjack':
+            flags |= PLAYER_BLACKJACK
+        if engine.dealer.hands[0].is_blackjack():
+            flags |= DEALER_BLACKJACK
+
+        wagered = sum(engine.bets)
+        net = engine.returned - wagered
+        actions = "".join(engine.actions).encode("ascii")
+        body = bytearray(RECORD.pack(self.next_round, time.time(), self.session, engine.stake, wagered, net,
+                                     flags, kind, len(dealer_cards), len(player_hands), len(actions)))
+        body += bytes(card.code for card in dealer_cards)
+        for hand in player_hands:
+            body.append(len(hand.cards))
+            body += bytes(card.code for card in hand.cards)
+        body += actions
+
+        offset = self._data.tell()
+        self._data.write(body)
+        self._data.flush()
+        self._index.write(INDEX.pack(offset, self.session, net, kind))
+        self._index.flush()
+        self.next_round += 1
+
+    # --------- Leitura ---------
+    def _view(self, path):
+        # Remapeia só quando o arquivo cresceu
+        size = os.path.getsize(path)
+        cached = self._maps.get(path)
+        if cached is None or cached[0] != size:
+            if cached is not None:
+                cached[1].close()
+            if not size:
+                return b""
+            with open(path, "rb") as f:
+                cached = (size, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            self._maps[path] = cached
+        return cached[1]
+
+    def __len__(self):
+        return os.path.getsize(self.index_path) // INDEX.size
+
+    def entry(self, i):
+        """(offset, session, net, hand_type) of round i."""
+        return INDEX.unpack_from(self._view(self.index_path), i * INDEX.size)
+
+    def entries(self, start=0, stop=None):
+        stop = len(self) if stop is None else stop
+        view = self._view(self.index_path)
+        return INDEX.iter_unpack(view[start * INDEX.size:stop * INDEX.size])
+
+    def record(self, i):
+        offset = self.entry(i)[0]
+        data = self._view(self.path)
+        (number, stamp, session, bet, wagered, net, flags, kind,
+         n_dealer, n_hands, n_actions) = RECORD.unpack_from(data, offset)
+        pos = offset + RECORD.size
+        dealer = [CARDS[c] for c in data[pos:pos + n_dealer]]
+        pos += n_dealer
+        hands = []
+        for _ in range(n_hands):
+            n = data[pos]
+            hands.append([CARDS[c] for c in data[pos + 1:pos + 1 + n]])
+            pos += 1 + n
+        actions = bytes(data[pos:pos + n_actions]).decode("ascii")
+        return {
+            "round": number, "time": stamp, "session": session, "bet": bet,
+            "wagered": wagered, "net": net, "hand_type": HAND_TYPES[kind],
+            "doubled": bool(flags & DOUBLED), "split": bool(flags & SPLIT),
+            "player_blackjack": bool(flags & PLAYER_BLACKJACK),
+            "dealer_blackjack": bool(flags & DEALER_BLACKJACK),
+            "dealer": dealer, "hands": hands, "actions": actions,
+        }
+
+    def page(self, start, count):
+        """Records start..start+count-1 (clipped to the ledger)."""
+        return [self.record(i) for i in range(max(0, start), min(len(self), start + count))]
+
+    def last(self, n):
+        total = len(self)
+        return self.page(total - n, n)
+
+    def session_range(self, session=None):
+        """(first, stop) round indexes of a session; rounds of one session are contiguous."""
+        session = self.session if session is None else session
+        if session == self.session:
+            return self.session_start, len(self)
+        return self._first_of(session), self._first_of(session + 1)
+
+    def _first_of(self, session):
+        # Busca binária: sessões crescem junto com o índice
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.entry(mid)[1] < session:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def session_rounds(self, session=None):
+        return range(*self.session_range(session))
+
+    def net_by_hand_type(self, session=None):
+        """{hand type: (rounds, net)} over the whole ledger, or one session if given."""
+        start, stop = (0, len(self)) if session is None else self.session_range(session)
+        totals = {name: [0, 0] for name in HAND_TYPES}
+        for _, _, net, kind in self.entries(start, stop):
+            totals[HAND_TYPES[kind]][0] += 1
+            totals[HAND_TYPES[kind]][1] += net
+        return {name: tuple(v) for name, v in totals.items()}
+
+    def close(self):
+        for _, view in self._maps.values():
+            view.close()
+        self._maps.clear()
+        self._data.close()
+        self._index.close()
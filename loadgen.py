@@ -0,0 +1,161 @@
+import argparse
+import asyncio
+import json
+import random
+import resource
+import time
+from server import TableServer, DEFAULT_PORT
+
+
+class Connection:
+    """One TCP connection carrying many seats; replies are matched to requests by id."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.pending = {}
+        self.next_id = 0
+        self.first_table = None
+        self.reader_task = None
+
+    @classmethod
+    async def open(cls, host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        conn = cls(reader, writer)
+        hello = json.loads(await reader.readline())
+        conn.first_table = hello['state']['table']
+        conn.reader_task = asyncio.create_task(conn.read_replies())
+        return conn
+
+    async def read_replies(self):
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                break
+            reply = json.loads(line)
+            future = self.pending.pop(reply.get('id'), None)
+            if future is not None and not future.done():
+                future.set_result(reply)
+        for future in self.pending.values():
+            future.set_exception(ConnectionError("server closed the connection"))
+
+    async def request(self, **message):
+        self.next_id += 1
+        message['id'] = self.next_id
+        future = asyncio.get_running_loop().create_future()
+        self.pending[self.next_id] = future
+        self.writer.write((json.dumps(message) + "\n").encode())
+        return await future
+
+    async def close(self):
+        self.writer.close()
+        await self.reader_task
+
+
+async def play_seat(conn, table, rounds, latencies, think=0.0):
+    """
+    Play `rounds` rounds at one table, hitting below 17, pausing about
+    `think` seconds before each action like a person would. Per-action
+    latency (request to reply) goes to `latencies`.
+    """
+    rng = random.Random(table)
+    played = 0
+    for _ in range(rounds):
+        if think:
+            await asyncio.sleep(think * rng.uniform(0.5, 1.5))
+        start = time.perf_counter()
+        reply = await conn.request(table=table, action='deal')
+        latencies.append(time.perf_counter() - start)
+        if not reply['ok']:
+            break
+        state = reply['state']
+        while state['state'] == 'playing':
+            action = 'hit' if state['values'][state['current']] < 17 else 'stand'
+            if think:
+                await asyncio.sleep(think * rng.uniform(0.5, 1.5))
+            start = time.perf_counter()
+            reply = await conn.request(table=table, action=action)
+            latencies.append(time.perf_counter() - start)
+            state = reply['state']
+        played += 1
+    return played
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
+
+
+def rss_kb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+async def run(seats, connections, rounds, host, port, local, think=0.0):
+    server = None
+    if local:
+        server = TableServer(bankroll=10 ** 9, seed=0)
+        await server.start(host, 0)
+        port = server.port()
+
+    rss_before = rss_kb()
+    conns = [await Connection.open(host, port) for _ in range(connections)]
+    # Cada conexão já tem uma mesa; abre o resto e distribui em rodízio
+    tables = [(conn, conn.first_table) for conn in conns]
+    for i in range(seats - len(tables)):
+        conn = conns[i % connections]
+        reply = await conn.request(action='open')
+        if not reply['ok']:
+            raise SystemExit(f"could not open seat {len(tables)}: {reply['error']}")
+        tables.append((conn, reply['state']['table']))
+    tables = tables[:seats]
+    rss_tables = rss_kb() - rss_before
+
+    latencies = []
+    start = time.perf_counter()
+    played = await asyncio.gather(*(play_seat(conn, table, rounds, latencies, think) for conn, table in tables))
+    elapsed = time.perf_counter() - start
+    for conn in conns:
+        await conn.close()
+    if server is not None:
+        server.server.close()
+        await server.server.wait_closed()
+
+    latencies.sort()
+    report = {
+        "seats": len(tables),
+        "connections": connections,
+        "rounds": sum(played),
+        "actions": len(latencies),
+        "seconds": elapsed,
+        "actions_per_s": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "max_ms": latencies[-1] * 1000 if latencies else 0.0,
+    }
+    if local:
+        # Só faz sentido com o servidor no mesmo processo
+        report["kb_per_table"] = rss_tables / len(tables)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator: many seats playing concurrently against server.py.")
+    parser.add_argument("--seats", type=int, default=2000)
+    parser.add_argument("--connections", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=10, help="rounds per seat")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--think", type=float, default=0.5,
+                        help="mean pause before each action in seconds (0 = closed loop, as fast as possible)")
+    parser.add_argument("--local", action="store_true", help="start the server in this process on a free port")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args.seats, min(args.connections, args.seats), args.rounds,
+                             args.host, args.port, args.local, args.think))
+    for key, value in report.items():
+        print(f"{key:>14}: {value:.2f}" if isinstance(value, float) else f"{key:>14}: {value}")
+
+
+if __name__ == "__main__":
+    main()
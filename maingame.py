@@ -1,29 +1,43 @@
+import argparse
+import atexit
 import pygame
 import sys
 import os
-from Configs import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from Configs import SCREEN_WIDTH, SCREEN_HEIGHT
 from jogo import Game
+from scheduler import FrameScheduler
+from profiler import profiler
 
 # Add the parent directory to sys.path to import menu
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from menu import Menu
 
-def main():
+def main(profile_csv=None):
     pygame.init()
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Casino Clássico - Blackjack")
-    clock = pygame.time.Clock()
+
+    # FPS cheio só com animação ou input; parado, espera por eventos
+    scheduler = FrameScheduler()
+
+    # Tempos por fase dos últimos quadros, gravados ao sair (F3 mostra na tela)
+    if profile_csv:
+        atexit.register(profiler.dump_csv, profile_csv)
 
     # Show menu
     menu = Menu(screen)
-    action = menu.run()
+    action = menu.run(scheduler)
     if action == "start_game":
         game = Game(screen)
         while True:
-            events = pygame.event.get()
+            profiler.begin_frame()
+            events = scheduler.wait(busy=game.is_busy())
+            profiler.lap('wait')
             game.handle_events(events)
             game.render()
-            clock.tick(FPS)
+            profiler.end_frame()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Casino Clássico - Blackjack")
+    parser.add_argument("--profile-csv", metavar="PATH", help="write per-phase frame timings to PATH on exit")
+    main(parser.parse_args().profile_csv)
\ No newline at end of file
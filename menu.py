@@ -1,8 +1,8 @@
 import pygame
 import sys
-import os
-from Configs import SCREEN_WIDTH, SCREEN_HEIGHT, TABLE_COLOR, TEXT_COLOR
 from botao import Button
+from atlas import load_atlas
+from scheduler import FrameScheduler
 
 class Menu:
     def __init__(self, screen):
@@ -10,21 +10,19 @@ class Menu:
         self.font = pygame.font.SysFont("serif", 36, bold=True)
         self.small_font = pygame.font.SysFont("serif", 24, bold=True)
 
-        # Load logo
-        logo_path = os.path.join(os.path.dirname(__file__), "logo", "logo.jpg")
-        self.logo = pygame.image.load(logo_path).convert_alpha()
-        # Scale logo to full screen size
-        self.logo = pygame.transform.smoothscale(self.logo, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Logo already scaled to full screen size in the image atlas
+        self.logo = load_atlas()['logo']
 
         # Buttons
         btn_y = self.screen.get_height() // 2 + 50
         self.btn_start = Button((self.screen.get_width() // 2 - 100, btn_y, 200, 50), "Start Game", self.small_font)
         self.btn_quit = Button((self.screen.get_width() // 2 - 100, btn_y + 70, 200, 50), "Quit", self.small_font)
 
-    def run(self):
+    def run(self, scheduler=None):
+        scheduler = scheduler or FrameScheduler()
         while True:
             #No green background, logo covers the screen
-            events = pygame.event.get()
+            events = scheduler.wait()
 
             for event in events:
                 if event.type == pygame.QUIT:
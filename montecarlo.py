@@ -0,0 +1,123 @@
+import numpy as np
+from Configs import RANKS, VALUES
+
+# Valor de cada rank (índice em RANKS), ás vale 1
+RANK_VALUES = np.array([VALUES[r] for r in RANKS], dtype=np.int8)
+ACE = RANKS.index('ace')
+
+# Cartas sempre reservadas depois do corte, suficiente para fechar qualquer rodada
+RESERVE_CARDS = 26
+
+
+def build_shoes(n_shoes, num_decks, rng):
+    """N embaralhados independentes, cada linha é um shoe de índices de RANKS."""
+    one_shoe = np.tile(np.repeat(np.arange(len(RANKS), dtype=np.int8), 4), num_decks)
+    return rng.permuted(np.broadcast_to(one_shoe, (n_shoes, one_shoe.size)), axis=1)
+
+
+def _best(hard, soft):
+    # Conta um ás como 11 quando não estoura
+    return np.where(soft & (hard + 10 <= 21), hard + 10, hard)
+
+
+class _Hands:
+    """Estado vetorizado de uma mão por shoe: total duro, flag de ás e nº de cartas."""
+
+    def __init__(self, n):
+        self.hard = np.zeros(n, dtype=np.int16)
+        self.soft = np.zeros(n, dtype=bool)
+        self.count = np.zeros(n, dtype=np.int16)
+
+    def add(self, idx, ranks):
+        self.hard[idx] += RANK_VALUES[ranks]
+        self.soft[idx] |= ranks == ACE
+        self.count[idx] += 1
+
+    def best(self, idx=slice(None)):
+        return _best(self.hard[idx], self.soft[idx])
+
+
+def _draw(shoes, ptr, idx):
+    ranks = shoes[idx, ptr[idx]]
+    ptr[idx] += 1
+    return ranks
+
+
+def _play_round(shoes, ptr, rows, stand_on, totals):
+    n = rows.size
+    player = _Hands(n)
+    dealer = _Hands(n)
+    everyone = np.arange(n)
+
+    # Deal cards in order: player, dealer, player, dealer
+    for hand in (player, dealer, player, dealer):
+        hand.add(everyone, _draw(shoes, ptr, rows))
+
+    p_bj = player.best() == 21
+    d_bj = dealer.best() == 21
+    natural = p_bj | d_bj
+    totals['rounds'] += n
+    totals['wagered'] += n
+    totals['push'] += np.count_nonzero(p_bj & d_bj)
+    totals['blackjack'] += np.count_nonzero(p_bj & ~d_bj)
+    totals['dealer_blackjack'] += np.count_nonzero(d_bj & ~p_bj)
+    totals['returned'] += np.count_nonzero(p_bj & d_bj) + 2.5 * np.count_nonzero(p_bj & ~d_bj)
+
+    # Jogador compra até stand_on (ou 21), como RoundEngine.hit/stand
+    live = np.flatnonzero(~natural)
+    active = live
+    while active.size:
+        active = active[player.best(active) < stand_on]
+        if active.size:
+            player.add(active, _draw(shoes, ptr, rows[active]))
+
+    # Dealer compra abaixo de 17 (Dealer.should_hit), mesmo se o jogador estourou
+    active = live
+    while active.size:
+        active = active[dealer.best(active) < 17]
+        if active.size:
+            dealer.add(active, _draw(shoes, ptr, rows[active]))
+
+    p = player.best(live)
+    d = dealer.best(live)
+    p_bust = p > 21
+    d_bust = d > 21
+    win = ~p_bust & (d_bust | (p > d))
+    push = ~p_bust & ~d_bust & (p == d)
+    totals['player_bust'] += np.count_nonzero(p_bust)
+    totals['dealer_bust'] += np.count_nonzero(d_bust)
+    totals['win'] += np.count_nonzero(win)
+    totals['push'] += np.count_nonzero(push)
+    totals['lose'] += live.size - np.count_nonzero(win) - np.count_nonzero(push)
+    totals['returned'] += 2 * np.count_nonzero(win) + np.count_nonzero(push)
+
+
+def simulate(rounds, num_decks=4, stand_on=17, penetration=0.75, n_shoes=20000, seed=None):
+    """
+    Play at least `rounds` flat-bet (1 unit) rounds over batches of `n_shoes`
+    shoes at once, with the rules of engine.RoundEngine: 2.5x blackjack,
+    dealer stands on all 17s, blackjacks settled at the deal. The player hits
+    below `stand_on` and never splits or doubles.
+
+    Returns a dict of totals: rounds, win, lose, push, blackjack,
+    dealer_blackjack, player_bust, dealer_bust, wagered, returned, net.
+    """
+    rng = np.random.default_rng(seed)
+    shoe_size = 52 * num_decks
+    cut = min(int(shoe_size * penetration), shoe_size - RESERVE_CARDS)
+    totals = dict.fromkeys(('rounds', 'win', 'lose', 'push', 'blackjack', 'dealer_blackjack',
+                            'player_bust', 'dealer_bust', 'wagered'), 0)
+    totals['returned'] = 0.0
+
+    while totals['rounds'] < rounds:
+        batch = min(n_shoes, max(1, (rounds - totals['rounds']) * 5 // cut + 1))
+        shoes = build_shoes(batch, num_decks, rng)
+        ptr = np.zeros(batch, dtype=np.intp)
+        rows = np.arange(batch)
+        while rows.size:
+            _play_round(shoes, ptr, rows, stand_on, totals)
+            rows = rows[ptr[rows] < cut]
+
+    totals = {k: (int(v) if k != 'returned' else float(v)) for k, v in totals.items()}
+    totals['net'] = totals['returned'] - totals['wagered']
+    return totals
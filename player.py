@@ -1,4 +1,5 @@
 from cartas import Hand
+from dealer_odds import composition, dealer_probabilities
 
 class Player:
     def __init__(self):
@@ -70,4 +71,19 @@ class Dealer(Player):
 
     def should_hit(self):
         best = self.hands[0].best_value()
-        return best < 17
\ No newline at end of file
+        return best < 17
+
+    def upcard(self):
+        # A primeira carta fica virada durante a rodada
+        cards = self.hands[0].cards
+        return cards[1] if len(cards) > 1 else None
+
+    def unseen_composition(self, deck):
+        # A carta virada volta para as cartas desconhecidas do jogador
+        counts = list(composition(deck))
+        counts[self.hands[0].cards[0].points - 1] += 1
+        return tuple(counts)
+
+    def outcome_probabilities(self, deck):
+        """Exact final-total distribution as seen from the table."""
+        return dealer_probabilities(self.upcard(), self.unseen_composition(deck))
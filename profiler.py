@@ -0,0 +1,89 @@
+import csv
+from array import array
+from time import perf_counter
+
+# Fases de um quadro, na ordem em que acontecem no loop
+PHASES = ('wait', 'events', 'scaling', 'regions', 'sprites', 'background', 'dealer', 'player',
+          'message', 'bank', 'buttons', 'overlay', 'flip')
+
+
+class FrameProfiler:
+    """
+    Per-phase frame timings in a fixed-size ring buffer.
+
+    The loop calls begin_frame(), then lap(phase) at the end of each phase
+    (the time since the previous lap is charged to that phase), then
+    end_frame(). Only the last `capacity` frames are kept, in one flat
+    array of floats, so recording costs a few perf_counter() calls and no
+    allocation per frame.
+    """
+
+    def __init__(self, capacity=600, phases=PHASES):
+        self.phases = phases
+        self.index = {name: i for i, name in enumerate(phases)}
+        self.capacity = capacity
+        self.width = len(phases) + 1  # última coluna: duração total do quadro
+        self.samples = array('d', [0.0]) * (capacity * self.width)
+        self.count = 0
+        self.current = array('d', [0.0]) * self.width
+        self.frame_start = self.last = perf_counter()
+
+    def begin_frame(self):
+        self.frame_start = self.last = perf_counter()
+        for i in range(self.width):
+            self.current[i] = 0.0
+
+    def lap(self, phase):
+        now = perf_counter()
+        self.current[self.index[phase]] += now - self.last
+        self.last = now
+
+    def end_frame(self):
+        self.current[-1] = perf_counter() - self.frame_start
+        row = (self.count % self.capacity) * self.width
+        self.samples[row:row + self.width] = self.current
+        self.count += 1
+
+    def rows(self):
+        """Recorded frames, oldest first, as arrays of seconds (phases..., total)."""
+        n = min(self.count, self.capacity)
+        first = self.count - n
+        for k in range(first, self.count):
+            row = (k % self.capacity) * self.width
+            yield self.samples[row:row + self.width]
+
+    def stats(self):
+        """
+        FPS over the buffer, p50/p99 of the frame time spent working (idle
+        wait excluded) and the mean of each phase in ms, slowest first.
+        """
+        rows = list(self.rows())
+        if not rows:
+            return {"frames": 0, "fps": 0.0, "p50_ms": 0.0, "p99_ms": 0.0, "phases": []}
+        wait = self.index['wait']
+        total = sum(row[-1] for row in rows)
+        work = sorted(row[-1] - row[wait] for row in rows)
+        means = [(name, sum(row[i] for row in rows) / len(rows) * 1000)
+                 for i, name in enumerate(self.phases) if name != 'wait']
+        means.sort(key=lambda item: -item[1])
+        return {
+            "frames": len(rows),
+            "fps": len(rows) / total if total else 0.0,
+            "p50_ms": work[len(work) // 2] * 1000,
+            "p99_ms": work[min(len(work) - 1, int(len(work) * 0.99))] * 1000,
+            "phases": means,
+        }
+
+    def dump_csv(self, path):
+        """Write the buffer to `path`, one frame per row, times in ms."""
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("frame",) + tuple(f"{name}_ms" for name in self.phases) + ("total_ms",))
+            first = self.count - min(self.count, self.capacity)
+            for k, row in enumerate(self.rows(), first):
+                writer.writerow([k] + [f"{value * 1000:.4f}" for value in row])
+        return path
+
+
+# Profiler compartilhado pelo loop principal e pelo Game
+profiler = FrameProfiler()
@@ -0,0 +1,159 @@
+import argparse
+import glob
+import json
+import os
+import random
+import sys
+import time
+import zlib
+from Configs import BASE_DIR
+from cartas import Shoe
+from engine import RoundEngine, Wallet, ACTION_CODES
+
+REPLAY_DIR = os.path.join(BASE_DIR, "replays")
+REPLAY_VERSION = 1
+
+ACTION_NAMES = {code: name for name, code in ACTION_CODES.items()}
+DEAL = 'N'
+OUTCOME_CODES = {'lose': 'l', 'win': 'w', 'blackjack': 'b', 'push': 'p', 'dealer_blackjack': 'd'}
+
+
+def result_crc(engine):
+    return f"{zlib.crc32(engine.message.encode()):08x}"
+
+
+def checkpoint(engine):
+    """'=amount:outcomes:crc' written after every settled round and checked on replay."""
+    outcomes = "".join(OUTCOME_CODES[o] for o in engine.outcomes)
+    return f"={engine.wallet.amount}:{outcomes}:{result_crc(engine)}"
+
+
+class SessionRecorder:
+    """
+    Records a session as a compact text stream: a JSON header with the
+    shoe seed and setup, then one line per round of tokens:
+
+        B25 N H S =1040:w:5d0c2a11
+
+    B<n> is a bet change, N a deal, H/S/P/D the player's actions
+    (ACTION_CODES) and the =amount:outcomes:crc checkpoint holds the bank
+    after the round, one letter per hand outcome and the CRC of the result
+    message. With the seed and the actions, replay() rebuilds every card.
+    """
+
+    def __init__(self, engine, seed, path, num_decks, penetration, continuous=False):
+        self.engine = engine
+        self.path = path
+        self.bet = engine.wallet.bet
+        self.tokens = []
+        header = {"version": REPLAY_VERSION, "seed": seed, "decks": num_decks, "penetration": penetration,
+                  "continuous": continuous, "amount": engine.wallet.amount, "bet": self.bet,
+                  "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.file = open(path, "w")
+        self.file.write(json.dumps(header) + "\n")
+        self.file.flush()
+
+    @classmethod
+    def for_engine(cls, engine, seed, directory=REPLAY_DIR):
+        shoe = engine.deck
+        name = time.strftime("session-%Y%m%d-%H%M%S") + f"-{seed:x}.rec"
+        return cls(engine, seed, os.path.join(directory, name), shoe.num_decks,
+                   getattr(shoe, 'penetration', 1.0), getattr(shoe, 'continuous', False))
+
+    def action(self, action):
+        """engine.on_action hook."""
+        if action == 'deal':
+            # A aposta só importa no deal: registra quando mudou desde o último
+            bet = self.engine.wallet.bet
+            if bet != self.bet:
+                self.tokens.append(f"B{bet}")
+                self.bet = bet
+            self.tokens.append(DEAL)
+        else:
+            self.tokens.append(ACTION_CODES[action])
+
+    def settled(self, engine):
+        """engine.on_settled hook: closes the round's line."""
+        self.tokens.append(checkpoint(engine))
+        self.file.write(" ".join(self.tokens) + "\n")
+        self.file.flush()
+        self.tokens = []
+
+    def close(self):
+        self.file.close()
+
+
+def read_session(path):
+    with open(path) as f:
+        header = json.loads(f.readline())
+        rounds = [line.split() for line in f if line.strip()]
+    return header, rounds
+
+
+def replay(path):
+    """
+    Re-run a recorded session headless. Returns a report dict; `mismatches`
+    lists (round, expected, got) for every checkpoint that differs, or a
+    refused action.
+    """
+    header, rounds = read_session(path)
+    if header.get("version") != REPLAY_VERSION:
+        raise ValueError(f"{path}: unsupported replay version {header.get('version')}")
+    shoe = Shoe(header["decks"], header["penetration"], header["continuous"], rng=random.Random(header["seed"]))
+    wallet = Wallet(header["amount"], header["bet"])
+    engine = RoundEngine(shoe, wallet)
+    mismatches = []
+    played = 0
+    start = time.perf_counter()
+    for number, tokens in enumerate(rounds, 1):
+        for token in tokens:
+            if token[0] == 'B':
+                wallet.bet = int(token[1:])
+                continue
+            if token[0] == '=':
+                got = checkpoint(engine)
+                if got != token:
+                    mismatches.append((number, token, got))
+                continue
+            if token == DEAL:
+                ok = engine.deal()
+                played += 1
+            elif token in ACTION_NAMES:
+                ok = engine.play(ACTION_NAMES[token])
+            else:
+                raise ValueError(f"{path}: bad token {token!r} in round {number}")
+            if not ok:
+                mismatches.append((number, token, f"refused: {engine.message}"))
+                break
+    elapsed = time.perf_counter() - start
+    return {"path": path, "rounds": played, "seconds": elapsed,
+            "rounds_per_s": played / elapsed if elapsed else 0.0,
+            "amount": wallet.amount, "mismatches": mismatches}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded sessions headless and check bank and outcomes.")
+    parser.add_argument("paths", nargs="*", help=f"session files (default: every .rec in {REPLAY_DIR})")
+    args = parser.parse_args()
+
+    paths = args.paths or sorted(glob.glob(os.path.join(REPLAY_DIR, "*.rec")))
+    failed = 0
+    for path in paths:
+        try:
+            report = replay(path)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"{os.path.basename(path)}: cannot replay: {e}")
+            failed += 1
+            continue
+        status = "OK" if not report["mismatches"] else f"{len(report['mismatches'])} MISMATCH(ES)"
+        print(f"{os.path.basename(path)}: {report['rounds']} rounds, {report['rounds_per_s']:.0f} rounds/s, "
+              f"bank {report['amount']}: {status}")
+        for number, expected, got in report["mismatches"][:5]:
+            print(f"  round {number}: expected {expected}, got {got}")
+        failed += bool(report["mismatches"])
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
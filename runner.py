@@ -0,0 +1,108 @@
+import argparse
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from cartas import Shoe
+from engine import RoundEngine, Wallet, WIN, BLACKJACK, PUSH
+
+# Rodadas por bloco; cada bloco tem seu próprio RNG derivado da seed
+CHUNK_ROUNDS = 20000
+
+REPORT_KEYS = ('rounds', 'hands', 'win', 'lose', 'push', 'blackjack',
+               'splits', 'doubles', 'wagered', 'net', 'net_sq')
+
+
+def mimic_dealer(engine):
+    """Default policy: hit below 17, never split or double."""
+    hand = engine.player.hands[engine.player.current_hand]
+    return 'hit' if hand.best_value() < 17 else 'stand'
+
+
+def chunk_seed(seed, index):
+    return f"{seed}:{index}"
+
+
+def run_chunk(args):
+    """Play one block of rounds with its own seeded shoe. Runs in a worker process."""
+    seed, index, rounds, num_decks, penetration, bet, policy = args
+    rng = random.Random(chunk_seed(seed, index))
+    # Bankroll grande o bastante para nunca recusar aposta
+    wallet = Wallet(initial_amount=10 ** 18, bet=bet)
+    engine = RoundEngine(Shoe(num_decks, penetration, rng=rng), wallet)
+    report = dict.fromkeys(REPORT_KEYS, 0)
+
+    for _ in range(rounds):
+        before = wallet.amount
+        engine.deal()
+        while engine.state == 'playing':
+            engine.play(policy(engine))
+        net = wallet.amount - before
+        report['rounds'] += 1
+        report['hands'] += len(engine.bets)
+        report['splits'] += len(engine.bets) - 1
+        report['doubles'] += sum(engine.doubled)
+        report['wagered'] += sum(engine.bets)
+        report['net'] += net
+        report['net_sq'] += net * net
+        for outcome in engine.outcomes:
+            if outcome == WIN:
+                report['win'] += 1
+            elif outcome == BLACKJACK:
+                report['blackjack'] += 1
+            elif outcome == PUSH:
+                report['push'] += 1
+            else:
+                report['lose'] += 1
+    return report
+
+
+def merge(reports):
+    total = dict.fromkeys(REPORT_KEYS, 0)
+    for report in reports:
+        for key in REPORT_KEYS:
+            total[key] += report[key]
+    rounds = total['rounds'] or 1
+    total['ev_per_round'] = total['net'] / rounds
+    total['variance_per_round'] = total['net_sq'] / rounds - total['ev_per_round'] ** 2
+    return total
+
+
+def simulate(rounds, workers=1, seed=0, num_decks=4, penetration=0.75, bet=10, policy=mimic_dealer):
+    """
+    Play `rounds` rounds split into fixed blocks of CHUNK_ROUNDS, each with its
+    own random.Random seeded from (seed, block index), over a process pool.
+
+    Blocks are reduced in index order with integer arithmetic, so the report
+    is bit-for-bit identical for the same seed whatever the worker count.
+    `policy(engine) -> action` must be a module-level function (picklable).
+    """
+    jobs = []
+    for index, start in enumerate(range(0, rounds, CHUNK_ROUNDS)):
+        jobs.append((seed, index, min(CHUNK_ROUNDS, rounds - start), num_decks, penetration, bet, policy))
+
+    if workers <= 1:
+        return merge(map(run_chunk, jobs))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return merge(pool.map(run_chunk, jobs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel blackjack round simulation")
+    parser.add_argument("--rounds", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--decks", type=int, default=4)
+    parser.add_argument("--penetration", type=float, default=0.75)
+    parser.add_argument("--bet", type=int, default=10)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    report = simulate(args.rounds, args.workers, args.seed, args.decks, args.penetration, args.bet)
+    elapsed = time.perf_counter() - start
+    for key, value in report.items():
+        print(f"{key:>20}: {value}")
+    print(f"{'rounds/s':>20}: {report['rounds'] / elapsed:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import pygame
+from Configs import FPS, IDLE_TIMEOUT_MS, ACTIVE_LINGER_MS
+
+
+class FrameScheduler:
+    """
+    Decides how long a loop iteration waits before the next frame.
+
+    While something moves (the caller passes busy=True) or for a short
+    linger after the last input, frames are paced by Clock.tick(fps) as
+    before. Otherwise the loop blocks in pygame.event.wait() until an event
+    arrives or idle_timeout ms pass, so an idle table costs almost no CPU
+    but still refreshes now and then.
+    """
+
+    def __init__(self, fps=FPS, idle_timeout=IDLE_TIMEOUT_MS, linger=ACTIVE_LINGER_MS):
+        self.fps = fps
+        self.idle_timeout = idle_timeout
+        self.linger = linger
+        self.clock = pygame.time.Clock()
+        self.active_until = 0
+        self.frames = 0
+        self.idle_frames = 0
+
+    def is_active(self):
+        return pygame.time.get_ticks() < self.active_until
+
+    def wait(self, busy=False):
+        """Wait for the next frame; returns the events that arrived meanwhile."""
+        if busy:
+            self.active_until = pygame.time.get_ticks() + self.linger
+        self.frames += 1
+        if self.is_active():
+            self.clock.tick(self.fps)
+            events = pygame.event.get()
+        else:
+            self.idle_frames += 1
+            first = pygame.event.wait(self.idle_timeout)
+            events = [] if first.type == pygame.NOEVENT else [first] + pygame.event.get()
+            self.clock.tick()  # só para o relógio não acumular o tempo ocioso
+        if events:
+            self.active_until = pygame.time.get_ticks() + self.linger
+        return events
@@ -0,0 +1,216 @@
+import argparse
+import asyncio
+import json
+import random
+from cartas import Shoe
+from engine import RoundEngine, Wallet
+from runner import chunk_seed
+
+DEFAULT_PORT = 8765
+ACTIONS = ('deal', 'hit', 'stand', 'split', 'double')
+# Linhas processadas por conexão antes de ceder o loop às outras mesas
+YIELD_EVERY = 32
+
+
+class TableSession:
+    """
+    One table: its own shoe, dealer and wallet around a RoundEngine.
+
+    Nothing here touches pygame or the disk, so a session is a few small
+    objects (the shoe is a bytearray of card codes) and thousands fit in
+    one process.
+    """
+    __slots__ = ('table_id', 'engine')
+
+    def __init__(self, table_id, num_decks=6, penetration=0.75, bankroll=1000, bet=10, rng=None):
+        self.table_id = table_id
+        self.engine = RoundEngine(Shoe(num_decks, penetration, rng=rng), Wallet(bankroll, bet))
+
+    def handle(self, request):
+        """Apply one request dict; returns the reply dict (without the echoed id)."""
+        action = request.get('action', 'state')
+        engine = self.engine
+        if action in ACTIONS:
+            before = engine.message
+            ok = engine.play(action)
+            reply = {'ok': bool(ok)}
+            if not ok:
+                # O engine explica algumas recusas (sem saldo etc.) na mensagem
+                reply['error'] = engine.message if engine.message != before else f"cannot {action} now"
+        elif action == 'bet':
+            ok, error = self.set_bet(request.get('amount'))
+            reply = {'ok': ok}
+            if error:
+                reply['error'] = error
+        elif action == 'state':
+            reply = {'ok': True}
+        else:
+            return {'ok': False, 'error': f"unknown action {action!r}"}
+        reply['state'] = self.snapshot()
+        return reply
+
+    def set_bet(self, amount):
+        wallet = self.engine.wallet
+        if self.engine.state == 'playing':
+            return False, "cannot change the bet during a round"
+        if not isinstance(amount, int) or isinstance(amount, bool):
+            return False, "amount must be an integer"
+        if amount < wallet.min_bet or amount > wallet.amount:
+            return False, f"bet must be between {wallet.min_bet} and {wallet.amount}"
+        wallet.bet = amount
+        return True, None
+
+    def snapshot(self):
+        engine = self.engine
+        player = engine.player
+        dealer_cards = engine.dealer.hands[0].cards
+        playing = engine.state == 'playing'
+        # Hole card (a primeira do dealer) fica escondida enquanto o jogador joga
+        dealer = [('??' if playing and i == 0 else card.label()) for i, card in enumerate(dealer_cards)]
+        return {
+            'table': self.table_id,
+            'state': engine.state,
+            'message': engine.message,
+            'amount': engine.wallet.amount,
+            'bet': engine.wallet.bet,
+            'hands': [[card.label() for card in hand.cards] for hand in player.hands],
+            'values': [hand.best_value() for hand in player.hands],
+            'current': player.current_hand,
+            'dealer': dealer,
+            'outcomes': engine.outcomes,
+            'can': [name for name in ACTIONS if getattr(engine, 'can_' + name)()],
+        }
+
+
+class TableServer:
+    """
+    Line-JSON TCP server hosting many independent tables.
+
+    Each request is one JSON object per line:
+        {"id": 7, "table": 3, "action": "hit"}
+    and gets one reply line with the same "id". "action" is one of deal,
+    hit, stand, split, double, bet (with "amount"), state, open or close.
+    A connection gets one table on connect (announced in a hello line) and
+    may open more with "open"; requests without "table" go to the first
+    one. A connection's tables are dropped when it disconnects.
+    """
+
+    def __init__(self, num_decks=6, penetration=0.75, bankroll=1000, bet=10, seed=None, max_tables=100000):
+        self.num_decks = num_decks
+        self.penetration = penetration
+        self.bankroll = bankroll
+        self.bet = bet
+        self.seed = seed
+        self.max_tables = max_tables
+        self.tables = {}
+        self.next_id = 0
+        self.requests = 0
+        self.server = None
+
+    def open_table(self):
+        if len(self.tables) >= self.max_tables:
+            return None
+        table_id = self.next_id
+        self.next_id += 1
+        # Seed fixa -> cada mesa tem seu próprio shoe reproduzível
+        rng = random.Random(chunk_seed(self.seed, table_id)) if self.seed is not None else None
+        session = TableSession(table_id, self.num_decks, self.penetration, self.bankroll, self.bet, rng)
+        self.tables[table_id] = session
+        return session
+
+    def dispatch(self, request, owned, default):
+        """Reply dict for one decoded request from a connection owning `owned` table ids."""
+        action = request.get('action', 'state')
+        if not isinstance(action, str):
+            return {'ok': False, 'error': "action must be a string"}
+        if action == 'open':
+            session = self.open_table()
+            if session is None:
+                return {'ok': False, 'error': "server full"}
+            owned.add(session.table_id)
+            return {'ok': True, 'state': session.snapshot()}
+        table_id = request.get('table', default)
+        if not isinstance(table_id, int) or isinstance(table_id, bool):
+            return {'ok': False, 'error': "table must be an integer"}
+        if table_id not in owned:
+            return {'ok': False, 'error': f"no table {table_id!r} on this connection"}
+        if action == 'close':
+            owned.discard(table_id)
+            del self.tables[table_id]
+            return {'ok': True}
+        return self.tables[table_id].handle(request)
+
+    async def handle_client(self, reader, writer):
+        owned = set()
+        first = self.open_table()
+        if first is None:
+            writer.write(b'{"ok": false, "error": "server full"}\n')
+            writer.close()
+            return
+        owned.add(first.table_id)
+        writer.write((json.dumps({'hello': True, 'state': first.snapshot()}) + "\n").encode())
+        handled = 0
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("request must be a JSON object")
+                except ValueError as e:
+                    reply = {'ok': False, 'error': f"bad request: {e}"}
+                else:
+                    reply = self.dispatch(request, owned, first.table_id)
+                    if 'id' in request:
+                        reply['id'] = request['id']
+                self.requests += 1
+                writer.write((json.dumps(reply) + "\n").encode())
+                await writer.drain()
+                # Um cliente com muitas linhas no buffer não segura as outras mesas
+                handled += 1
+                if handled % YIELD_EVERY == 0:
+                    await asyncio.sleep(0)
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            for table_id in owned:
+                self.tables.pop(table_id, None)
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=DEFAULT_PORT):
+        self.server = await asyncio.start_server(self.handle_client, host, port)
+        return self.server
+
+    def port(self):
+        return self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self, host="127.0.0.1", port=DEFAULT_PORT):
+        server = await self.start(host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Line-JSON TCP server hosting many blackjack tables.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--decks", type=int, default=6)
+    parser.add_argument("--penetration", type=float, default=0.75)
+    parser.add_argument("--bankroll", type=int, default=1000, help="starting amount of each table")
+    parser.add_argument("--bet", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=None, help="seed for reproducible shoes (one per table)")
+    parser.add_argument("--max-tables", type=int, default=100000)
+    args = parser.parse_args()
+
+    server = TableServer(args.decks, args.penetration, args.bankroll, args.bet, args.seed, args.max_tables)
+    print(f"Serving tables on {args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
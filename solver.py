@@ -0,0 +1,127 @@
+from functools import lru_cache
+from dealer_odds import dealer_probabilities
+
+ACTIONS = ('hit', 'stand', 'double', 'split')
+
+
+def _dealer_dist(up, comp, hit_soft_17=False):
+    """
+    Dealer final totals given that the dealer has no blackjack: a dealer
+    natural ends the round at the deal, so by the time the player acts it is
+    already ruled out. Returns (p17, p18, p19, p20, p21, p_bust).
+    """
+    probs = dealer_probabilities(up, comp, hit_soft_17)
+    rest = 1.0 - probs['blackjack']
+    if rest <= 0:
+        return (0.0,) * 5 + (1.0,)
+    return tuple(probs[k] / rest for k in (17, 18, 19, 20, 21, 'bust'))
+
+
+def _stand_ev(total, dist, natural, blackjack_pays=1.5):
+    if total > 21:
+        return -1.0
+    ev = dist[5]
+    for i in range(5):
+        d = 17 + i
+        if total > d:
+            ev += dist[i]
+        elif total < d:
+            ev -= dist[i]
+        elif natural:
+            # engine.hand_payout: 21 de duas cartas após split paga 2.5x contra 21
+            ev += blackjack_pays * dist[i]
+    return ev
+
+
+def _best(hard, has_ace):
+    return hard + 10 if has_ace and hard + 10 <= 21 else hard
+
+
+class _Table:
+    """
+    EVs for one (up-card, composition); draw odds are taken from that composition.
+    `hit_soft_17` and `blackjack_pays` are rule variants for chart.py; the
+    defaults are the table's rules.
+    """
+
+    def __init__(self, up, comp, hit_soft_17=False, blackjack_pays=1.5):
+        remaining = sum(comp)
+        self.draws = [(i + 1, c / remaining) for i, c in enumerate(comp) if c]
+        self.dist = _dealer_dist(up, comp, hit_soft_17)
+        self.blackjack_pays = blackjack_pays
+        self._played = {}
+
+    def stand(self, hard, has_ace, natural=False):
+        return _stand_ev(_best(hard, has_ace), self.dist, natural, self.blackjack_pays)
+
+    def hit(self, hard, has_ace):
+        return sum(p * self.played(hard + v, has_ace or v == 1) for v, p in self.draws)
+
+    def played(self, hard, has_ace):
+        # Valor da mão jogada da melhor forma entre hit e stand (sem double)
+        key = (hard, has_ace)
+        ev = self._played.get(key)
+        if ev is None:
+            if hard > 21:
+                ev = -1.0
+            elif _best(hard, has_ace) == 21:
+                ev = self.stand(hard, has_ace)  # RoundEngine.hit para em 21
+            else:
+                ev = max(self.stand(hard, has_ace), self.hit(hard, has_ace))
+            self._played[key] = ev
+        return ev
+
+    def double(self, hard, has_ace):
+        return 2 * sum(p * self.stand(hard + v, has_ace or v == 1) for v, p in self.draws)
+
+    def split(self, pair_value, can_double):
+        # Cada mão recebe uma carta e segue com hit/stand/double; sem re-split
+        ev = 0.0
+        for v, p in self.draws:
+            hard = pair_value + v
+            has_ace = pair_value == 1 or v == 1
+            if _best(hard, has_ace) == 21:
+                best = self.stand(hard, has_ace, natural=True)
+            else:
+                best = max(self.stand(hard, has_ace), self.hit(hard, has_ace))
+                if can_double:
+                    best = max(best, self.double(hard, has_ace))
+            ev += p * best
+        return 2 * ev
+
+
+@lru_cache(maxsize=4096)
+def _action_values(hard, has_ace, natural, up, comp, can_double, split_value):
+    table = _Table(up, comp)
+    values = {
+        'stand': table.stand(hard, has_ace, natural),
+        'hit': table.hit(hard, has_ace),
+    }
+    if can_double:
+        values['double'] = table.double(hard, has_ace)
+    if split_value:
+        values['split'] = table.split(split_value, can_double)
+    return values
+
+
+def action_values(hand, upcard, comp, can_double=False, can_split=False):
+    """
+    Expected value, per unit of the hand's stake, of each action allowed for
+    `hand` against `upcard` with the unseen cards `comp` (see
+    dealer_odds.composition). Follows the RoundEngine rules: dealer stands on
+    all 17s, double takes one card, split hands may double but not re-split.
+    Draw odds use `comp` as it stands now, not after each later hit.
+
+    Results are cached by (hand state, up-card, composition).
+    """
+    up = getattr(upcard, 'points', upcard)
+    natural = len(hand.cards) == 2 and hand.best_value() == 21
+    split_value = hand.cards[0].points if can_split else 0
+    return _action_values(hand.hard, hand.has_ace, natural, up, tuple(comp),
+                          bool(can_double), split_value)
+
+
+def best_action(hand, upcard, comp, can_double=False, can_split=False):
+    """(action, ev) with the highest expected value."""
+    values = action_values(hand, upcard, comp, can_double, can_split)
+    return max(values.items(), key=lambda item: item[1])
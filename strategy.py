@@ -0,0 +1,158 @@
+import os
+from Configs import BASE_DIR
+from solver import ACTIONS
+
+STRATEGY_DIR = os.path.join(BASE_DIR, "strategies")
+BASIC_STRATEGY_FILE = os.path.join(STRATEGY_DIR, "basic_s17_das.txt")
+
+# Categorias de linha da tabela
+HARD, SOFT, PAIR = 0, 1, 2
+ROW_PREFIX = {'h': HARD, 's': SOFT, 'p': PAIR}
+MAX_TOTAL = 21
+# Colunas do arquivo, na ordem usual das tabelas: 2..10, A (ás = 1)
+UP_ORDER = (2, 3, 4, 5, 6, 7, 8, 9, 10, 1)
+
+# Códigos de célula (bytes na tabela)
+HIT, STAND, DOUBLE_OR_HIT, DOUBLE_OR_STAND, SPLIT, NO_SPLIT = b'HSDTP-'
+CELL_CODES = frozenset(b'HSDTP-')
+# Linhas de par só dizem se separa; as outras, a jogada
+_PAIR_CODES = frozenset(b'P-')
+_PLAY_CODES = frozenset(b'HSDT')
+
+# Índice em ACTIONS ('hit', 'stand', 'double', 'split') por código e por double permitido
+_ACTION_INDEX = {
+    HIT: (0, 0), STAND: (1, 1), DOUBLE_OR_HIT: (0, 2), DOUBLE_OR_STAND: (1, 2),
+}
+
+
+def cell(category, total, up):
+    """Flat index of (category, total or pair card, dealer up-card)."""
+    return (category * (MAX_TOTAL + 1) + total) * 11 + up
+
+
+def default_table():
+    """Hit below 17 (hard) / 18 (soft), never split: the fallback for rows a file leaves out."""
+    table = bytearray(cell(PAIR + 1, 0, 0))
+    for total in range(MAX_TOTAL + 1):
+        for up in range(1, 11):
+            table[cell(HARD, total, up)] = HIT if total < 17 else STAND
+            table[cell(SOFT, total, up)] = HIT if total < 18 else STAND
+            table[cell(PAIR, total, up)] = NO_SPLIT
+    return table
+
+
+class Strategy:
+    """
+    A fixed playing strategy compiled into one flat byte table indexed by
+    (hard/soft/pair, player total or pair card, dealer up-card), so a
+    decision is a couple of arithmetic steps and one index.
+
+    A Strategy is a policy: strategy(engine) returns the action for the
+    engine's current hand, the same signature runner.simulate() and the
+    table's bot mode take. decide() works on a Hand directly and
+    decide_batch() on NumPy arrays of many hands at once.
+    """
+
+    def __init__(self, table, name="custom"):
+        self.table = bytes(table)
+        self.name = name
+        self._batch = None
+
+    # --------- Arquivo ---------
+    @classmethod
+    def load(cls, path):
+        """
+        Read the compact text format: one row per line, e.g. `h16 SSSSSHHHHH`
+        or `p8 PPPPPPPPPP`, the cells for dealer 2..10, A. '#' starts a comment.
+        """
+        table = default_table()
+        with open(path) as f:
+            for number, line in enumerate(f, 1):
+                line = line.split('#', 1)[0].strip()
+                if not line:
+                    continue
+                try:
+                    key, cells = line.split()
+                    category = ROW_PREFIX[key[0]]
+                    total = 10 if key[1:] == 'T' else 1 if key[1:] == 'A' else int(key[1:])
+                except (ValueError, KeyError):
+                    raise ValueError(f"{path}:{number}: bad row {line!r}") from None
+                cells = cells.encode('ascii')
+                if len(cells) != len(UP_ORDER) or not set(cells) <= CELL_CODES or not 0 < total <= MAX_TOTAL:
+                    raise ValueError(f"{path}:{number}: bad row {line!r}")
+                if not set(cells) <= (_PAIR_CODES if category == PAIR else _PLAY_CODES):
+                    raise ValueError(f"{path}:{number}: pair rows use P/-, other rows H/S/D/T")
+                for up, code in zip(UP_ORDER, cells):
+                    table[cell(category, total, up)] = code
+        return cls(table, os.path.splitext(os.path.basename(path))[0])
+
+    def save(self, path):
+        names = {HARD: 'h', SOFT: 's', PAIR: 'p'}
+        rows = {HARD: range(4, 22), SOFT: range(12, 22), PAIR: range(1, 11)}
+        with open(path, "w") as f:
+            f.write(f"# {self.name}\n# Columns: dealer up-card 2 3 4 5 6 7 8 9 T A\n")
+            for category, totals in rows.items():
+                for total in totals:
+                    label = 'T' if category == PAIR and total == 10 else str(total)
+                    cells = bytes(self.table[cell(category, total, up)] for up in UP_ORDER)
+                    f.write(f"{names[category]}{label:<3} {cells.decode('ascii')}\n")
+
+    # --------- Decisão ---------
+    def decide(self, hand, up, can_double=False, can_split=False):
+        """Action name for `hand` against dealer up-card points `up` (ace = 1)."""
+        table = self.table
+        can_double = bool(can_double)
+        if can_split and table[cell(PAIR, hand.cards[0].points, up)] == SPLIT:
+            return 'split'
+        hard = hand.hard
+        if hand.has_ace and hard <= 11:
+            code = table[cell(SOFT, hard + 10, up)]
+        else:
+            code = table[cell(HARD, min(hard, MAX_TOTAL), up)]
+        return ACTIONS[_ACTION_INDEX[code][can_double]]
+
+    def __call__(self, engine):
+        """Policy for RoundEngine: action for the current hand."""
+        hand = engine.player.hands[engine.player.current_hand]
+        return self.decide(hand, engine.dealer.upcard().points, engine.can_double(), engine.can_split())
+
+    def decide_batch(self, hard, has_ace, up, pair_card=None, can_double=None):
+        """
+        Vectorized decide(): NumPy arrays of hard totals, soft flags, up-cards
+        (ace = 1), pair card points (0 = cannot split) and double flags.
+        Returns an array of indices into solver.ACTIONS.
+        """
+        import numpy as np  # só as decisões em lote precisam de NumPy
+        if self._batch is None:
+            codes = np.frombuffer(self.table, dtype=np.uint8)
+            # Ação por código, sem e com double permitido
+            lookup = np.zeros((256, 2), dtype=np.int8)
+            for code, (plain, doubled) in _ACTION_INDEX.items():
+                lookup[code] = (plain, doubled)
+            self._batch = (codes, lookup)
+        codes, lookup = self._batch
+
+        hard = np.asarray(hard)
+        up = np.asarray(up)
+        soft = np.asarray(has_ace, dtype=bool) & (hard <= 11)
+        total = np.where(soft, hard + 10, np.minimum(hard, MAX_TOTAL))
+        row = np.where(soft, SOFT, HARD)
+        code = codes[(row * (MAX_TOTAL + 1) + total) * 11 + up]
+        double = np.zeros(hard.shape, dtype=np.int8) if can_double is None else np.asarray(can_double, dtype=np.int8)
+        actions = lookup[code, double].astype(np.int8)
+        if pair_card is not None:
+            pair_card = np.asarray(pair_card)
+            split = (pair_card > 0) & (codes[(PAIR * (MAX_TOTAL + 1) + pair_card) * 11 + up] == SPLIT)
+            actions[split] = ACTIONS.index('split')
+        return actions
+
+
+_basic = None
+
+
+def basic_strategy():
+    """The bundled basic strategy for the table's rules (loaded once)."""
+    global _basic
+    if _basic is None:
+        _basic = Strategy.load(BASIC_STRATEGY_FILE)
+    return _basic
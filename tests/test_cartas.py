@@ -0,0 +1,14 @@
+from cartas import Card, Hand
+
+
+def test_values_are_a_copy():
+    hand = Hand()
+    hand.add(Card('ace', '♠'))
+    hand.add(Card('6', '♥'))
+    values = hand.values()
+    assert values == [17, 7]
+    values.append(27)
+    values[0] = 0
+    assert hand.values() == [17, 7]
+    assert hand.best_value() == 17
+    assert hand.is_soft()
@@ -0,0 +1,48 @@
+import json
+
+from journal import BankJournal
+
+
+def write_lines(path, *entries):
+    with open(path, "a") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+def test_torn_last_line_is_cut(tmp_path):
+    snapshot = str(tmp_path / "bank.json")
+    journal = BankJournal(snapshot)
+    write_lines(journal.journal_path, *({"amount": a, "bet": 10, "seq": a} for a in (1, 2, 3)))
+    # Crash no meio do append: a última linha ficou pela metade
+    with open(journal.journal_path, "a") as f:
+        f.write('{"amount": 4, "se')
+
+    reopened = BankJournal(snapshot)
+    assert reopened.recover() == {"amount": 3, "bet": 10, "seq": 3}
+    with open(journal.journal_path) as f:
+        assert f.read().endswith('"seq": 3}\n')
+
+    # O próximo append começa numa linha própria
+    reopened._append({"amount": 5, "bet": 10, "seq": reopened.seq + 1})
+    assert BankJournal(snapshot).recover() == {"amount": 5, "bet": 10, "seq": 4}
+
+
+def test_line_without_newline_is_not_durable(tmp_path):
+    snapshot = str(tmp_path / "bank.json")
+    journal = BankJournal(snapshot)
+    write_lines(journal.journal_path, {"amount": 1, "seq": 1})
+    with open(journal.journal_path, "a") as f:
+        f.write('{"amount": 2, "seq": 2}')
+
+    assert journal.recover() == {"amount": 1, "seq": 1}
+    journal._append({"amount": 3, "seq": 2})
+    assert BankJournal(snapshot).recover() == {"amount": 3, "seq": 2}
+
+
+def test_recover_after_close(tmp_path):
+    snapshot = str(tmp_path / "bank.json")
+    journal = BankJournal(snapshot, compact_every=2)
+    for amount in (990, 980, 1000):
+        journal.record({"amount": amount, "bet": 10})
+    journal.close()
+    assert BankJournal(snapshot).recover()["amount"] == 1000
@@ -0,0 +1,69 @@
+import os
+import random
+
+import pytest
+
+from cartas import Shoe
+from engine import RoundEngine, Wallet
+from ledger import RoundLedger, INDEX, RECORD
+
+
+def play(ledger, rounds, seed=1):
+    engine = RoundEngine(Shoe(4, rng=random.Random(seed)), Wallet(10 ** 9))
+    engine.on_settled = ledger.append_round
+    for _ in range(rounds):
+        engine.deal()
+        while engine.state == 'playing':
+            hand = engine.player.hands[engine.player.current_hand]
+            engine.play('hit' if hand.best_value() < 15 else 'stand')
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "rounds.ledger")
+
+
+def records(ledger):
+    return [ledger.record(i) for i in range(len(ledger))]
+
+
+def test_record_cut_mid_append(path):
+    ledger = RoundLedger(path)
+    play(ledger, 6)
+    before = records(ledger)
+    cut = ledger.entry(5)[0]
+    ledger.close()
+    # Crash no meio do último registro: o índice aponta para dados incompletos
+    size = os.path.getsize(path)
+    with open(path, "r+b") as f:
+        f.truncate(size - 3)
+
+    ledger = RoundLedger(path)
+    assert records(ledger) == before[:-1]
+    assert os.path.getsize(path) == cut
+    play(ledger, 2, seed=2)
+    after = records(ledger)
+    assert after[:5] == before[:5]
+    assert [r["round"] for r in after] == list(range(7))
+    ledger.close()
+
+
+def test_partial_index_entry_and_trailing_data(path):
+    ledger = RoundLedger(path)
+    play(ledger, 4)
+    before = records(ledger)
+    ledger.close()
+    # Crash entre os dois writes: dados do registro gravados, entrada do índice pela metade
+    with open(path, "ab") as f:
+        f.write(RECORD.pack(4, 0.0, 1, 10, 10, 0, 0, 0, 2, 1, 1)[:RECORD.size - 5])
+    with open(path + ".idx", "ab") as f:
+        f.write(b"\x00" * (INDEX.size - 3))
+
+    ledger = RoundLedger(path)
+    assert records(ledger) == before
+    assert os.path.getsize(path + ".idx") == 4 * INDEX.size
+    play(ledger, 3, seed=3)
+    assert records(ledger)[:4] == before
+    assert len(ledger) == 7
+    assert ledger.record(6)["round"] == 6
+    ledger.close()
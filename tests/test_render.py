@@ -0,0 +1,68 @@
+import os
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from cartas import Card, Shoe
+
+
+def stack(shoe, *cards):
+    """Swap `cards` to the top of the shoe so they are drawn first, in order."""
+    for card in cards:
+        top = shoe.remaining - 1
+        i = shoe.shoe.rindex(card.code, 0, top + 1)
+        shoe.shoe[i], shoe.shoe[top] = shoe.shoe[top], shoe.shoe[i]
+        shoe.remaining -= 1
+    shoe.remaining += len(cards)
+
+
+@pytest.fixture(params=[(1913, 1071), (1279, 719)], ids=lambda size: "%dx%d" % size)
+def game(request, tmp_path, monkeypatch):
+    pygame.init()
+    # Escalas não inteiras: as posições float dos sprites arredondam diferente na tela
+    screen = pygame.display.set_mode(request.param)
+    clock = [0]
+    monkeypatch.setattr(pygame.time, "get_ticks", lambda: clock[0])
+    from jogo import Game
+    game = Game(screen, bank_file=str(tmp_path / "bank.json"),
+                ledger_path=str(tmp_path / "rounds.ledger"), replay_dir=None)
+    game.engine.deck = Shoe(4, rng=random.Random(7))
+    game.clock = clock
+    yield game
+    pygame.quit()
+
+
+def test_incremental_frames_match_full_repaint(game):
+    """Every frame drawn through the dirty rects equals draw_table() over the whole screen."""
+    # Par de oitos contra um 10: a primeira rodada separa e as cartas cruzam o destaque da mão
+    stack(game.engine.deck, Card('8', '♠'), Card('10', '♥'), Card('8', '♦'), Card('7', '♣'))
+    full = pygame.Surface(game.screen.get_size())
+    mouse = game.mouse_position()
+    frames = 0
+    splits = 0
+    for _ in range(3):
+        game.start_round()
+        while True:
+            game.clock[0] += 16
+            game.render()
+            frames += 1
+            full.fill((0, 0, 0))
+            game.draw_table(full, mouse)
+            if game.screen.get_view("2").raw != full.get_view("2").raw:
+                pytest.fail(f"frame {frames}: incremental render differs from a full repaint")
+            if game.sprites:
+                continue
+            if game.state != 'playing':
+                break
+            if game.engine.can_split():
+                game.player_split()
+                splits += 1
+            elif game.player.hands[game.player.current_hand].best_value() < 17:
+                game.player_hit()
+            else:
+                game.player_stand()
+    assert splits and frames > 20
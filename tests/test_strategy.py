@@ -0,0 +1,20 @@
+import pytest
+
+from strategy import Strategy, basic_strategy, BASIC_STRATEGY_FILE
+
+
+def load(tmp_path, text):
+    path = tmp_path / "custom.txt"
+    path.write_text(text)
+    return Strategy.load(str(path))
+
+
+@pytest.mark.parametrize("row", ["h16 SSSSSHHHHP", "s18 SDDDDSS-HH", "p8 PPPPPPPPPH"])
+def test_load_rejects_codes_of_the_other_row_kind(tmp_path, row):
+    with pytest.raises(ValueError, match="pair rows use P/-"):
+        load(tmp_path, row + "\n")
+
+
+def test_load_reads_the_bundled_chart(tmp_path):
+    with open(BASIC_STRATEGY_FILE) as f:
+        assert load(tmp_path, f.read()).table == basic_strategy().table
@@ -0,0 +1,45 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    """
+    Bounded LRU cache of rendered text surfaces keyed by
+    (font, text, color, antialias). Surfaces returned are shared: blit them,
+    don't draw on them.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        key = (font, text, tuple(color), antialias)
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surf
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self.surfaces[key] = surf
+        if len(self.surfaces) > self.maxsize:
+            self.surfaces.popitem(last=False)
+        return surf
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.surfaces), "maxsize": self.maxsize}
+
+    def clear(self):
+        self.surfaces.clear()
+        self.hits = self.misses = 0
+
+
+# Cache compartilhado por Game, Bank e Button
+text_cache = TextCache()
+
+
+def render_text(font, text, antialias, color):
+    """Drop-in for font.render(text, antialias, color) that goes through text_cache."""
+    return text_cache.render(font, text, antialias, color)
@@ -0,0 +1,93 @@
+import math
+import pygame
+
+# Fonte base -> (nome, tamanho, negrito), para recriar em outra escala
+_FONT_SPECS = {}
+
+
+def sys_font(name, size, bold=False):
+    """pygame.font.SysFont that remembers its spec so a Viewport can rescale it."""
+    font = pygame.font.SysFont(name, size, bold=bold)
+    _FONT_SPECS[font] = (name, size, bold)
+    return font
+
+
+def outline(surf, color, rect, width):
+    """
+    Border of `rect`, `width` pixels thick, inside it, as four fills.
+    pygame.draw.rect with a width draws thick lines that come out different
+    when the surface is clipped, so a dirty-rect redraw would not match a
+    full one; fills clip exactly.
+    """
+    r = pygame.Rect(rect)
+    for edge in ((r.left, r.top, r.width, width), (r.left, r.bottom - width, r.width, width),
+                 (r.left, r.top, width, r.height), (r.right - width, r.top, width, r.height)):
+        surf.fill(color, edge)
+
+
+class Viewport:
+    """
+    Maps the 900x600 base layout onto a screen of any size, letterboxed.
+
+    The transform is computed once per resolution; scaled fonts and images
+    are built on first use and cached for the life of the viewport, so a
+    frame only blits ready-made surfaces at native resolution.
+    """
+
+    def __init__(self, base_size, screen_size):
+        base_w, base_h = base_size
+        screen_w, screen_h = screen_size
+        self.base_size = base_size
+        self.screen_size = screen_size
+        self.scale = min(screen_w / base_w, screen_h / base_h)
+        self.width = int(base_w * self.scale)
+        self.height = int(base_h * self.scale)
+        self.offset_x = (screen_w - self.width) // 2
+        self.offset_y = (screen_h - self.height) // 2
+        self.identity = self.scale == 1 and self.offset_x == 0 and self.offset_y == 0
+        self._fonts = {}
+        self._images = {}
+
+    def point(self, pos):
+        x, y = pos
+        # floor, como pygame.Rect faz com posições float (ex.: sprites)
+        return (self.offset_x + math.floor(x * self.scale), self.offset_y + math.floor(y * self.scale))
+
+    def length(self, n):
+        return max(1, round(n * self.scale)) if n else 0
+
+    def rect(self, rect):
+        # Arredonda para fora, para que retângulos sujos cubram todo o pixel
+        r = pygame.Rect(rect)
+        left = self.offset_x + math.floor(r.left * self.scale)
+        top = self.offset_y + math.floor(r.top * self.scale)
+        right = self.offset_x + math.ceil(r.right * self.scale)
+        bottom = self.offset_y + math.ceil(r.bottom * self.scale)
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def to_base(self, pos):
+        x, y = pos
+        return ((x - self.offset_x) / self.scale, (y - self.offset_y) / self.scale)
+
+    def font(self, font):
+        if self.identity or font not in _FONT_SPECS:
+            return font
+        scaled = self._fonts.get(font)
+        if scaled is None:
+            name, size, bold = _FONT_SPECS[font]
+            scaled = pygame.font.SysFont(name, self.length(size), bold=bold)
+            self._fonts[font] = scaled
+        return scaled
+
+    def image(self, surf):
+        if self.identity:
+            return surf
+        scaled = self._images.get(surf)
+        if scaled is None:
+            w, h = surf.get_size()
+            scaled = pygame.transform.smoothscale(surf, (self.length(w), self.length(h)))
+            self._images[surf] = scaled
+        return scaled
+
+    def blit(self, target, surf, pos):
+        return target.blit(self.image(surf), self.point(pos))